@@ -3,63 +3,78 @@
 Re-tag existing items with updated tagging rules.
 """
 
-import sqlite3
 import sys
 import os
+from contextlib import nullcontext
+from multiprocessing import Pool
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+# Add the project root to path so the src package (and its relative imports) resolves
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from rules import tag_topics, tag_asset_class, tag_geo
+from src import db
+from src.rules import tag_topics, tag_asset_class, tag_geo
 
-def retag_existing_items():
-    """Re-tag all existing items with current tagging rules."""
-    conn = sqlite3.connect('rss_dash.sqlite3')
-    conn.row_factory = sqlite3.Row
+TAG_INSERT_SQL = '''
+    INSERT OR IGNORE INTO item_tags (item_id, tag, confidence, tagger)
+    VALUES (?, ?, 1.0, 'retag_script')
+'''
 
-    try:
-        # Get all existing items
-        cursor = conn.execute('SELECT item_id, title FROM items')
-        items = cursor.fetchall()
+# Number of tag rows buffered before each executemany flush
+BATCH_SIZE = 5000
+
+# Number of items sent to a tagging worker process per task
+CHUNK_SIZE = 1000
+
+def tag_chunk(items):
+    """Tag a chunk of (item_id, title) pairs. Runs in a worker process."""
+    return [(item_id, tag_topics(title) + tag_asset_class(title) + tag_geo(title)) for item_id, title in items]
 
-        print(f'Re-tagging {len(items)} existing items with new rules...')
+def retag_existing_items(workers=None):
+    """Re-tag all existing items with current tagging rules (workers defaults to one per core)."""
+    # Separate connections so committing batches doesn't disturb the read cursor
+    read_conn = db.connect()
+    write_conn = db.connect()
+    workers = workers or os.cpu_count() or 1
+
+    try:
+        total = read_conn.execute('SELECT COUNT(*) FROM items').fetchone()[0]
+        print(f'Re-tagging {total} existing items with new rules...')
 
+        rows = []
         tagged_count = 0
-        for item in items:
-            item_id = item['item_id']
-            title = item['title'] or ''
-
-            # Apply new tagging rules
-            topics = tag_topics(title)
-            asset_classes = tag_asset_class(title)
-            geo_tags = tag_geo(title)
-
-            # Add new tags to item_tags table
-            for topic in topics:
-                conn.execute('''
-                    INSERT OR IGNORE INTO item_tags (item_id, tag, confidence, tagger)
-                    VALUES (?, ?, 1.0, 'retag_script')
-                ''', (item_id, topic))
-
-            for asset_class in asset_classes:
-                conn.execute('''
-                    INSERT OR IGNORE INTO item_tags (item_id, tag, confidence, tagger)
-                    VALUES (?, ?, 1.0, 'retag_script')
-                ''', (item_id, asset_class))
-
-            for geo_tag in geo_tags:
-                conn.execute('''
-                    INSERT OR IGNORE INTO item_tags (item_id, tag, confidence, tagger)
-                    VALUES (?, ?, 1.0, 'retag_script')
-                ''', (item_id, geo_tag))
-
-            if topics or asset_classes or geo_tags:
-                tagged_count += 1
-
-        conn.commit()
+        # Tagging is CPU-bound and independent per item, so fan it out to one
+        # process per core; only this process writes to SQLite.
+        with Pool(workers) if workers > 1 else nullcontext() as pool:
+            mapper = pool.map if pool else map
+            # Stream items from the cursor rather than loading the whole table
+            cursor = read_conn.execute('SELECT item_id, title FROM items')
+            while True:
+                chunks = []
+                for _ in range(workers):
+                    batch = cursor.fetchmany(CHUNK_SIZE)
+                    if not batch:
+                        break
+                    chunks.append([(item['item_id'], item['title'] or '') for item in batch])
+                if not chunks:
+                    break
+
+                for tagged in mapper(tag_chunk, chunks):
+                    for item_id, tags in tagged:
+                        rows.extend((item_id, tag) for tag in tags)
+                        if tags:
+                            tagged_count += 1
+
+                if len(rows) >= BATCH_SIZE:
+                    with write_conn:
+                        write_conn.executemany(TAG_INSERT_SQL, rows)
+                    rows.clear()
+
+        if rows:
+            with write_conn:
+                write_conn.executemany(TAG_INSERT_SQL, rows)
 
         # Check final count
-        cursor = conn.execute('SELECT COUNT(*) FROM item_tags WHERE tag = "trump"')
+        cursor = write_conn.execute('SELECT COUNT(*) FROM item_tags WHERE tag = "trump"')
         trump_tagged = cursor.fetchone()[0]
 
         print('✅ Re-tagging complete!')
@@ -67,7 +82,8 @@ def retag_existing_items():
         print(f'   {trump_tagged} items now tagged with "trump" topic')
 
     finally:
-        conn.close()
+        read_conn.close()
+        write_conn.close()
 
 if __name__ == '__main__':
     retag_existing_items()
@@ -10,7 +10,6 @@ rss_dash.py — zero-cost RSS narrative dashboard (single-file)
 from __future__ import annotations
 
 import os
-import sqlite3
 
 from src import db, web
 
@@ -70,8 +69,7 @@ SOURCES = [
 if __name__ == "__main__":
     db.init_db(SOURCES)
     # Run daily cleanup on startup if needed (using direct connection to avoid Flask context issues)
-    conn = sqlite3.connect(db.DB_PATH, check_same_thread=False, timeout=30.0)
-    conn.row_factory = sqlite3.Row
+    conn = db.connect()
     try:
         cleanup_stats = db.maybe_run_daily_cleanup(conn)
         if cleanup_stats["items_deleted"] > 0:
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import os
+import queue
 import sqlite3
-from typing import Any, Dict
+from typing import Any, Dict, List, Set, Tuple
 
 from flask import g
 
@@ -12,6 +13,9 @@ from . import rules
 
 DB_PATH = os.environ.get("RSS_DASH_DB", "rss_dash.sqlite3")
 
+# Print every SQL statement run (with bound values) when set, e.g. to feed EXPLAIN QUERY PLAN
+SQL_TRACE = bool(os.environ.get("RSS_DASH_SQL_TRACE"))
+
 SCHEMA_SQL = """
 PRAGMA journal_mode=WAL;
 PRAGMA synchronous=NORMAL;
@@ -36,11 +40,19 @@ CREATE TABLE IF NOT EXISTS items (
   guid TEXT,
   summary TEXT,
   raw_json TEXT,
+  effective_time TEXT GENERATED ALWAYS AS (COALESCE(published_at, fetched_at)) VIRTUAL,
   FOREIGN KEY (source_id) REFERENCES sources(source_id)
 );
 
-CREATE INDEX IF NOT EXISTS idx_items_published ON items(published_at);
+-- Every time window now filters on effective_time, so the old
+-- published_at/fetched_at indexes only slow down inserts
+DROP INDEX IF EXISTS idx_items_published;
+DROP INDEX IF EXISTS idx_items_published_fetched;
 CREATE INDEX IF NOT EXISTS idx_items_source ON items(source_id);
+-- Lets the dashboard filter and ORDER BY ... LIMIT on item time straight from the index;
+-- source_id and item_id ride along so the category and tag joins skip the table lookup
+DROP INDEX IF EXISTS idx_items_effective_time;
+CREATE INDEX IF NOT EXISTS idx_items_effective_time_source ON items(effective_time, source_id, item_id);
 
 CREATE TABLE IF NOT EXISTS tags (
   tag TEXT PRIMARY KEY,
@@ -68,6 +80,9 @@ CREATE TABLE IF NOT EXISTS signals (
   FOREIGN KEY (item_id) REFERENCES items(item_id)
 );
 
+-- Covers the per-item direction lookup in the framing queries
+CREATE INDEX IF NOT EXISTS idx_signals_item_direction ON signals(item_id, direction);
+
 CREATE TABLE IF NOT EXISTS source_status (
   source_id TEXT PRIMARY KEY,
   last_fetch_utc TEXT,
@@ -76,6 +91,8 @@ CREATE TABLE IF NOT EXISTS source_status (
   last_http_status INTEGER,
   items_seen_last_fetch INTEGER NOT NULL DEFAULT 0,
   items_added_last_fetch INTEGER NOT NULL DEFAULT 0,
+  etag TEXT,
+  last_modified TEXT,
   FOREIGN KEY (source_id) REFERENCES sources(source_id)
 );
 
@@ -87,18 +104,113 @@ CREATE TABLE IF NOT EXISTS maintenance_state (
 """
 
 
+# Per-connection settings (journal_mode=WAL persists in the file, the rest
+# reset on every connect): fewer fsyncs, 64 MB page cache, in-memory temp
+# tables and 256 MB of memory-mapped reads.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def connect() -> sqlite3.Connection:
+    """Open a connection to DB_PATH with WAL and the per-connection PRAGMAs applied."""
+    # Long-lived connections (the fetch loop's writer) reuse prepared statements across
+    # fetches; leave room beyond the default 128 for the variable-length IN lookups
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, timeout=30.0, cached_statements=512)
+    conn.row_factory = sqlite3.Row
+    # WAL and the PRAGMAs below are tuning only, so ignore errors (e.g. disk I/O
+    # errors in test/CI environments, or no WAL on a network filesystem); each
+    # is guarded on its own so one failure doesn't skip the rest
+    for pragma in ("PRAGMA journal_mode=WAL", *CONNECTION_PRAGMAS):
+        try:
+            conn.execute(pragma)
+        except sqlite3.OperationalError:
+            pass
+    if SQL_TRACE:
+        conn.set_trace_callback(print)
+    return conn
+
+
+# Request connections are handed back here instead of being closed, so the next
+# request skips connect() and finds SQLite's page cache already warm
+POOL_SIZE = 4
+_pool: "queue.LifoQueue[Tuple[str, sqlite3.Connection]]" = queue.LifoQueue(maxsize=POOL_SIZE)
+
+
 def get_db() -> sqlite3.Connection:
     if "db" not in g:
-        conn = sqlite3.connect(DB_PATH, check_same_thread=False, timeout=30.0)
-        conn.row_factory = sqlite3.Row
-        # Ensure WAL mode is enabled for better concurrency
-        conn.execute("PRAGMA journal_mode=WAL")
-        g.db = conn
+        g.db = _checkout()
+        g.db_path = DB_PATH
     return g.db
 
 
+def _checkout() -> sqlite3.Connection:
+    while True:
+        try:
+            path, conn = _pool.get_nowait()
+        except queue.Empty:
+            return connect()
+        if path == DB_PATH:
+            return conn
+        conn.close()  # DB_PATH changed since the connection was pooled
+
+
+def close_db(exc: BaseException | None = None) -> None:
+    """Return the request's connection to the pool, or close it if the pool is full."""
+    conn = g.pop("db", None)
+    path = g.pop("db_path", DB_PATH)
+    if conn is None:
+        return
+    # Discard uncommitted work, as closing the connection would
+    if conn.in_transaction:
+        conn.rollback()
+    try:
+        _pool.put_nowait((path, conn))
+    except queue.Full:
+        conn.close()
+
+
+# Columns added after their table was first released. CREATE TABLE IF NOT
+# EXISTS leaves existing tables alone, so init_db adds these to older databases.
+_ADDED_COLUMNS = [
+    # ALTER TABLE can only add VIRTUAL generated columns, which is also what SCHEMA_SQL uses
+    ("items", "effective_time", "TEXT GENERATED ALWAYS AS (COALESCE(published_at, fetched_at)) VIRTUAL"),
+    ("source_status", "etag", "TEXT"),
+    ("source_status", "last_modified", "TEXT"),
+]
+
+
+def _add_missing_columns(conn: sqlite3.Connection) -> None:
+    """Add _ADDED_COLUMNS to existing tables created before they existed."""
+    for table, column, decl in _ADDED_COLUMNS:
+        columns = [row[1] for row in conn.execute(f"PRAGMA table_xinfo({table})")]
+        if columns and column not in columns:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+
+
+def _rule_tags() -> list[tuple[str, str, str]]:
+    """(tag, tag_type, label) for every tag the tagging rules can emit."""
+    return (
+        [(tag, "topic", "topic") for tag in rules.TOPIC_RULES.keys()]
+        + [(tag, "asset_class", "asset class") for tag in rules.ASSET_CLASS_RULES.keys()]
+        + [(tag, "geo", "geo") for tag in rules.GEO_RULES.keys()]
+    )
+
+
+def seed_rule_tags(conn: sqlite3.Connection) -> None:
+    """Seed the tags table (topics, asset classes, and geo tags) from the tagging rules."""
+    conn.executemany(
+        TAG_SEED_SQL,
+        [(tag, tag_type, f"Auto {label} tag: {tag}") for tag, tag_type, label in _rule_tags()],
+    )
+
+
 def init_db(sources: list[Dict[str, Any]]) -> None:
-    conn = sqlite3.connect(DB_PATH, check_same_thread=False, timeout=30.0)
+    conn = connect()
+    _add_missing_columns(conn)
     conn.executescript(SCHEMA_SQL)
     conn.commit()
     # seed sources
@@ -109,31 +221,71 @@ def init_db(sources: list[Dict[str, Any]]) -> None:
             (s["source_id"], s["publisher"], s["feed_name"], s["category"], s["rss_url"], s.get("cadence_hint"),
              1 if s.get("enabled", True) else 0),
         )
-    # seed tags table (topics, asset classes, and geo tags)
-    for tag in rules.TOPIC_RULES.keys():
-        conn.execute(
-            "INSERT OR IGNORE INTO tags(tag, tag_type, description) VALUES(?,?,?)",
-            (tag, "topic", f"Auto topic tag: {tag}"),
-        )
-    for tag in rules.ASSET_CLASS_RULES.keys():
-        conn.execute(
-            "INSERT OR IGNORE INTO tags(tag, tag_type, description) VALUES(?,?,?)",
-            (tag, "asset_class", f"Auto asset class tag: {tag}"),
-        )
-    for tag in rules.GEO_RULES.keys():
-        conn.execute(
-            "INSERT OR IGNORE INTO tags(tag, tag_type, description) VALUES(?,?,?)",
-            (tag, "geo", f"Auto geo tag: {tag}"),
-        )
+    seed_rule_tags(conn)
     conn.commit()
     conn.close()
 
 
-def upsert_item_and_annotations(conn: sqlite3.Connection, item: Dict[str, Any]) -> None:
-    conn.execute(
-        """INSERT OR REPLACE INTO items(item_id,source_id,published_at,fetched_at,title,url,guid,summary,raw_json)
-           VALUES(?,?,?,?,?,?,?,?,?)""",
-        (
+ITEM_INSERT_SQL = """INSERT OR IGNORE INTO items(item_id,source_id,published_at,fetched_at,title,url,guid,summary,raw_json)
+   VALUES(?,?,?,?,?,?,?,?,?)"""
+# Takes the same row as ITEM_INSERT_SQL. Rows whose content is unchanged are left alone
+# (fetched_at keeps the first fetch time) so re-seen entries cost no page or WAL writes
+ITEM_UPDATE_SQL = """UPDATE items SET source_id=?2,published_at=?3,fetched_at=?4,title=?5,url=?6,guid=?7,summary=?8,raw_json=?9
+   WHERE item_id=?1
+     AND (source_id,published_at,title,url,guid,summary,raw_json) IS NOT (?2,?3,?5,?6,?7,?8,?9)"""
+# Update signals in place, and only when the rules produced something different,
+# rather than INSERT OR REPLACE deleting and re-inserting the row on every fetch
+SIGNAL_UPSERT_SQL = """INSERT INTO signals(item_id,direction,urgency,mode,notes,scorer)
+   VALUES(?,?,?,?,?,?)
+   ON CONFLICT(item_id) DO UPDATE SET
+     direction=excluded.direction,urgency=excluded.urgency,mode=excluded.mode,
+     notes=excluded.notes,scorer=excluded.scorer
+   WHERE (direction,urgency,mode,notes,scorer)
+     IS NOT (excluded.direction,excluded.urgency,excluded.mode,excluded.notes,excluded.scorer)"""
+TAG_SEED_SQL = "INSERT OR IGNORE INTO tags(tag, tag_type, description) VALUES(?,?,?)"
+ITEM_TAG_SQL = """INSERT OR IGNORE INTO item_tags(item_id,tag,confidence,tagger)
+   VALUES(?,?,?,?)"""
+
+# (item key, tag_type, description label) for each list of tags on an item
+_TAG_FIELDS = [
+    ("topics", "topic", "topic"),
+    ("asset_classes", "asset_class", "asset class"),
+    ("geo_tags", "geo", "geo"),
+]
+
+# init_db() seeds these, so upserts only need to seed tags from outside the rules
+_RULE_TAGS = {tag for tag, _, _ in _rule_tags()}
+
+# Item ids per "IN (...)" lookup, well below SQLite's bound-parameter limit
+_ID_LOOKUP_CHUNK = 500
+
+
+def _existing_item_ids(conn: sqlite3.Connection, item_ids: List[str]) -> Set[str]:
+    existing: Set[str] = set()
+    for i in range(0, len(item_ids), _ID_LOOKUP_CHUNK):
+        chunk = item_ids[i:i + _ID_LOOKUP_CHUNK]
+        placeholders = ",".join("?" * len(chunk))
+        rows = conn.execute(f"SELECT item_id FROM items WHERE item_id IN ({placeholders})", chunk)
+        existing.update(row[0] for row in rows)
+    return existing
+
+
+def upsert_items_and_annotations(conn: sqlite3.Connection, items: List[Dict[str, Any]]) -> int:
+    """
+    Insert or refresh a batch of items with their signals and tags, using one
+    executemany per statement. Returns the number of items that were new.
+    """
+    item_ids = list(dict.fromkeys(item["item_id"] for item in items))
+    existing = _existing_item_ids(conn, item_ids)
+
+    insert_rows = []
+    update_rows = []
+    signal_rows = []
+    tag_seed_rows: Dict[str, tuple] = {}
+    item_tag_rows = []
+    pending = set(item_ids) - existing
+    for item in items:
+        values = (
             item["item_id"],
             item["source_id"],
             item["published_at"],
@@ -143,53 +295,34 @@ def upsert_item_and_annotations(conn: sqlite3.Connection, item: Dict[str, Any])
             item.get("guid"),
             item.get("summary"),
             item.get("raw_json"),
-        ),
-    )
-    # signals
-    conn.execute(
-        """INSERT OR REPLACE INTO signals(item_id,direction,urgency,mode,notes,scorer)
-           VALUES(?,?,?,?,?,?)""",
-        (
-            item["item_id"],
-            item["direction"],
-            item["urgency"],
-            item["mode"],
-            item.get("notes"),
-            "rules_v0",
-        ),
-    )
-    # tags (topics, asset classes, geo tags)
-    # First ensure tags exist in tags table
-    for tag in item["topics"]:
-        conn.execute(
-            "INSERT OR IGNORE INTO tags(tag, tag_type, description) VALUES(?,?,?)",
-            (tag, "topic", f"Manual topic tag: {tag}"),
         )
-        conn.execute(
-            """INSERT OR IGNORE INTO item_tags(item_id,tag,confidence,tagger)
-               VALUES(?,?,?,?)""",
-            (item["item_id"], tag, 1.0, "rules_v1"),
-        )
-    for tag in item.get("asset_classes", []):
-        conn.execute(
-            "INSERT OR IGNORE INTO tags(tag, tag_type, description) VALUES(?,?,?)",
-            (tag, "asset_class", f"Manual asset class tag: {tag}"),
-        )
-        conn.execute(
-            """INSERT OR IGNORE INTO item_tags(item_id,tag,confidence,tagger)
-               VALUES(?,?,?,?)""",
-            (item["item_id"], tag, 1.0, "rules_v1"),
-        )
-    for tag in item.get("geo_tags", []):
-        conn.execute(
-            "INSERT OR IGNORE INTO tags(tag, tag_type, description) VALUES(?,?,?)",
-            (tag, "geo", f"Manual geo tag: {tag}"),
-        )
-        conn.execute(
-            """INSERT OR IGNORE INTO item_tags(item_id,tag,confidence,tagger)
-               VALUES(?,?,?,?)""",
-            (item["item_id"], tag, 1.0, "rules_v1"),
+        if item["item_id"] in pending:
+            pending.discard(item["item_id"])
+            insert_rows.append(values)
+        else:
+            # already stored (or repeated within this batch): refresh it
+            update_rows.append(values)
+        signal_rows.append(
+            (item["item_id"], item["direction"], item["urgency"], item["mode"], item.get("notes"), "rules_v0")
         )
+        for key, tag_type, label in _TAG_FIELDS:
+            for tag in item.get(key, []):
+                if tag not in _RULE_TAGS and tag not in tag_seed_rows:
+                    tag_seed_rows[tag] = (tag, tag_type, f"Manual {label} tag: {tag}")
+                item_tag_rows.append((item["item_id"], tag, 1.0, "rules_v1"))
+
+    conn.executemany(ITEM_INSERT_SQL, insert_rows)
+    conn.executemany(ITEM_UPDATE_SQL, update_rows)
+    conn.executemany(SIGNAL_UPSERT_SQL, signal_rows)
+    # First ensure tags exist in tags table
+    conn.executemany(TAG_SEED_SQL, tag_seed_rows.values())
+    conn.executemany(ITEM_TAG_SQL, item_tag_rows)
+    return len(insert_rows)
+
+
+def upsert_item_and_annotations(conn: sqlite3.Connection, item: Dict[str, Any]) -> bool:
+    """Insert or refresh an item with its signals and tags. Returns True if the item was new."""
+    return upsert_items_and_annotations(conn, [item]) == 1
 
 
 def get_retention_days() -> int:
@@ -221,40 +354,33 @@ def run_cleanup(conn: sqlite3.Connection) -> Dict[str, int]:
     retention_days = get_retention_days()
     cutoff = datetime.now() - timedelta(days=retention_days)
 
-    # Delete old items based on published_at if present, else fetched_at
-    # SQLite doesn't support CASCADE DELETE directly, so we need to delete from child tables first
-    cursor = conn.execute("""
-        SELECT item_id FROM items
-        WHERE (published_at IS NOT NULL AND published_at < ?) OR
-              (published_at IS NULL AND fetched_at < ?)
-    """, (cutoff.isoformat(), cutoff.isoformat()))
-
-    old_item_ids = [row["item_id"] for row in cursor.fetchall()]
-
-    if not old_item_ids:
-        return {"items_deleted": 0, "tags_deleted": 0, "signals_deleted": 0}
+    # Delete old items based on published_at if present, else fetched_at (effective_time).
+    # SQLite doesn't support CASCADE DELETE directly, so we need to delete from child tables first;
+    # each DELETE selects the old items through the effective_time index rather than binding
+    # every old item_id as a parameter.
+    old_items = "SELECT item_id FROM items WHERE effective_time < ?"
+    params = (cutoff.isoformat(),)
 
-    # Delete from child tables first
-    placeholders = ",".join("?" * len(old_item_ids))
+    # Commit the deletes together (or roll them all back) in one transaction
+    with conn:
+        tags_deleted = conn.execute(
+            f"DELETE FROM item_tags WHERE item_id IN ({old_items})", params
+        ).rowcount
 
-    tags_deleted = conn.execute(
-        f"DELETE FROM item_tags WHERE item_id IN ({placeholders})",
-        old_item_ids
-    ).rowcount
+        signals_deleted = conn.execute(
+            f"DELETE FROM signals WHERE item_id IN ({old_items})", params
+        ).rowcount
 
-    signals_deleted = conn.execute(
-        f"DELETE FROM signals WHERE item_id IN ({placeholders})",
-        old_item_ids
-    ).rowcount
+        items_deleted = conn.execute(
+            f"DELETE FROM items WHERE item_id IN ({old_items})", params
+        ).rowcount
 
-    items_deleted = conn.execute(
-        f"DELETE FROM items WHERE item_id IN ({placeholders})",
-        old_item_ids
-    ).rowcount
+        if not items_deleted:
+            return {"items_deleted": 0, "tags_deleted": 0, "signals_deleted": 0}
 
-    # Update maintenance state
-    from datetime import datetime, timezone
-    set_maintenance_state(conn, "last_cleanup", datetime.now(timezone.utc).isoformat())
+        # Update maintenance state
+        from datetime import datetime, timezone
+        set_maintenance_state(conn, "last_cleanup", datetime.now(timezone.utc).isoformat())
 
     return {
         "items_deleted": items_deleted,
@@ -293,7 +419,8 @@ def maybe_run_daily_cleanup(conn: sqlite3.Connection | None = None) -> Dict[str,
 
 def archive_old_items(conn: sqlite3.Connection, archive_days: int) -> str:
     """
-    Archive items older than archive_days to a compressed JSON file.
+    Archive items older than archive_days to a gzipped JSON Lines file: a header
+    object on the first line, then one item per line, streamed from the cursor.
     Returns the path to the created archive file.
     """
     import json
@@ -303,6 +430,12 @@ def archive_old_items(conn: sqlite3.Connection, archive_days: int) -> str:
 
     cutoff = datetime.now() - timedelta(days=archive_days)
 
+    total_items = conn.execute(
+        "SELECT COUNT(*) FROM items WHERE effective_time < ?", (cutoff.isoformat(),)
+    ).fetchone()[0]
+    if not total_items:
+        raise ValueError(f"No items found older than {archive_days} days to archive")
+
     # Get old items with all their data
     cursor = conn.execute("""
         SELECT
@@ -313,49 +446,39 @@ def archive_old_items(conn: sqlite3.Connection, archive_days: int) -> str:
             sig.direction,
             sig.urgency,
             sig.mode,
-            GROUP_CONCAT(DISTINCT it_topic.tag) as topics,
-            GROUP_CONCAT(DISTINCT it_asset.tag) as asset_classes,
-            GROUP_CONCAT(DISTINCT it_geo.tag) as geo_tags
+            GROUP_CONCAT(CASE WHEN t.tag_type = 'topic' THEN it.tag END) as topics,
+            GROUP_CONCAT(CASE WHEN t.tag_type = 'asset_class' THEN it.tag END) as asset_classes,
+            GROUP_CONCAT(CASE WHEN t.tag_type = 'geo' THEN it.tag END) as geo_tags
         FROM items i
         JOIN sources s ON s.source_id = i.source_id
         LEFT JOIN signals sig ON sig.item_id = i.item_id
-        LEFT JOIN item_tags it_topic ON it_topic.item_id = i.item_id
-            AND it_topic.tag IN (SELECT tag FROM tags WHERE tag_type = 'topic')
-        LEFT JOIN item_tags it_asset ON it_asset.item_id = i.item_id
-            AND it_asset.tag IN (SELECT tag FROM tags WHERE tag_type = 'asset_class')
-        LEFT JOIN item_tags it_geo ON it_geo.item_id = i.item_id
-            AND it_geo.tag IN (SELECT tag FROM tags WHERE tag_type = 'geo')
-        WHERE (i.published_at IS NOT NULL AND i.published_at < ?) OR
-              (i.published_at IS NULL AND i.fetched_at < ?)
+        -- one row per (item, tag), so no cross product between tag types
+        LEFT JOIN item_tags it ON it.item_id = i.item_id
+        LEFT JOIN tags t ON t.tag = it.tag
+        WHERE i.effective_time < ?
         GROUP BY i.item_id
-        ORDER BY COALESCE(i.published_at, i.fetched_at) DESC
-    """, (cutoff.isoformat(), cutoff.isoformat()))
-
-    old_items = []
-    for row in cursor.fetchall():
-        item_dict = dict(row)
-        # Parse comma-separated tag strings back to lists
-        item_dict['topics'] = item_dict['topics'].split(',') if item_dict['topics'] else []
-        item_dict['asset_classes'] = item_dict['asset_classes'].split(',') if item_dict['asset_classes'] else []
-        item_dict['geo_tags'] = item_dict['geo_tags'].split(',') if item_dict['geo_tags'] else []
-        old_items.append(item_dict)
-
-    if not old_items:
-        raise ValueError(f"No items found older than {archive_days} days to archive")
+        ORDER BY i.effective_time DESC
+    """, (cutoff.isoformat(),))
 
     # Create archive filename with timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     archive_dir = Path(DB_PATH).parent / "archives"
     archive_dir.mkdir(exist_ok=True)
-    archive_path = archive_dir / f"rss_archive_{timestamp}_{archive_days}days.json.gz"
+    archive_path = archive_dir / f"rss_archive_{timestamp}_{archive_days}days.jsonl.gz"
 
-    # Write compressed JSON
-    with gzip.open(archive_path, 'wt', encoding='utf-8') as f:
-        json.dump({
+    # Write compressed JSON Lines; level 1 is several times faster than gzip's default 9
+    with gzip.open(archive_path, 'wt', compresslevel=1, encoding='utf-8') as f:
+        f.write(json.dumps({
             "archived_at": datetime.now().isoformat(),
             "archive_days": archive_days,
-            "total_items": len(old_items),
-            "items": old_items
-        }, f, indent=2, default=str)
+            "total_items": total_items,
+        }) + "\n")
+        for row in cursor:
+            item_dict = dict(row)
+            # Parse comma-separated tag strings back to lists
+            item_dict['topics'] = item_dict['topics'].split(',') if item_dict['topics'] else []
+            item_dict['asset_classes'] = item_dict['asset_classes'].split(',') if item_dict['asset_classes'] else []
+            item_dict['geo_tags'] = item_dict['geo_tags'].split(',') if item_dict['geo_tags'] else []
+            f.write(json.dumps(item_dict, default=str) + "\n")
 
     return str(archive_path)
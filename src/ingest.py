@@ -6,7 +6,8 @@ import sqlite3
 import threading
 import urllib.error
 import urllib.request
-from typing import Any, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Tuple
 
 import feedparser
 
@@ -14,38 +15,58 @@ from . import db, rules, utils
 
 _last_fetch_status: Dict[str, Any] = {"last_run_utc": None, "last_error": None, "items_added": 0}
 
+# Bumped after every fetch_once() so readers can tell when cached results are stale
+_fetch_epoch = 0
+
 # Timeout for RSS fetch (seconds)
 FETCH_TIMEOUT = 30.0
 
+# Maximum number of feeds fetched concurrently
+FETCH_WORKERS = 8
+
 
-def fetch_feed_with_timeout(url: str) -> Tuple[Any, Optional[int], Optional[str]]:
+def fetch_feed_with_timeout(url: str, etag: Optional[str] = None,
+                            modified: Optional[str] = None) -> Tuple[Any, Optional[int], Optional[str]]:
     """
     Fetch RSS feed with timeout and retry logic.
     Returns: (parsed_feed, http_status, error_message)
     
     Only retries on transient errors (5xx, network timeouts).
     Does not retry on client errors (401, 403, 404, 429) to avoid being a nuisance.
+
+    etag/modified are the validators from the previous fetch; if the server
+    answers 304 Not Modified, returns (None, 304, None). The parsed feed carries
+    the new validators as parsed["etag"] and parsed["modified"].
     """
     import time
+
+    headers = {
+        "User-Agent": "RSS-Dash/1.0 (Personal RSS Aggregator)",
+        "Accept": "application/rss+xml, application/xml, text/xml, */*"
+    }
+    if etag:
+        headers["If-None-Match"] = etag
+    if modified:
+        headers["If-Modified-Since"] = modified
     
     # Try once, then retry once only on transient errors
     for attempt in range(2):
         try:
-            req = urllib.request.Request(
-                url, 
-                headers={
-                    "User-Agent": "RSS-Dash/1.0 (Personal RSS Aggregator)",
-                    "Accept": "application/rss+xml, application/xml, text/xml, */*"
-                }
-            )
+            req = urllib.request.Request(url, headers=headers)
             with urllib.request.urlopen(req, timeout=FETCH_TIMEOUT) as response:
                 http_status = response.getcode()
                 feed_bytes = response.read()
-                # Parse the feed from bytes
-                parsed = feedparser.parse(feed_bytes)
+                # Parse the feed from bytes. Summaries are only shown as
+                # autoescaped plain text, so skip feedparser's HTML sanitizer
+                # and relative-URI rewriting, which dominate parse time.
+                parsed = feedparser.parse(feed_bytes, sanitize_html=False, resolve_relative_uris=False)
+                parsed["etag"] = response.headers.get("ETag")
+                parsed["modified"] = response.headers.get("Last-Modified")
                 return parsed, http_status, None
         except urllib.error.HTTPError as e:
             http_status = e.code
+            if http_status == 304:
+                return None, http_status, None
             # Don't retry on client errors (4xx) - they're permanent or require auth
             if 400 <= http_status < 500:
                 # Special handling for common cases
@@ -77,139 +98,187 @@ def fetch_feed_with_timeout(url: str) -> Tuple[Any, Optional[int], Optional[str]
     return None, None, "Failed after retry"
 
 
+def build_items(source_id: str, parsed: Any) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Turn a parsed feed's entries into tagged item dicts ready for upsert.
+    Returns: (items, entries_seen)
+    """
+    items = []
+    seen = 0
+    # Every entry arrived in the same response, so they share one fetch time
+    fetched_at = utils.utcnow().isoformat()
+    for e in parsed.entries:
+        seen += 1
+        title = utils.normalize_ws(getattr(e, "title", "") or "")
+        url = getattr(e, "link", "") or ""
+        if not title or not url:
+            continue
+        guid = getattr(e, "id", None) or getattr(e, "guid", None)
+        published = utils.parse_published(e)
+        item_id = utils.stable_item_id(source_id, title, url, guid)
+
+        item = dict(
+            item_id=item_id,
+            source_id=source_id,
+            published_at=(published.isoformat() if published else None),
+            fetched_at=fetched_at,
+            title=title,
+            url=url,
+            guid=guid,
+            summary=utils.normalize_ws(getattr(e, "summary", "") or "")[:1000] or None,
+            raw_json=None,  # keep None v0; can store later if desired
+            notes=None,
+            # topics, asset_classes, geo_tags, direction, urgency, mode
+            **rules.apply_all_tagging(title),
+        )
+
+        items.append(item)
+    return items, seen
+
+
+def fetch_and_build_items(source: Any) -> Tuple[Any, Optional[int], Optional[str], List[Dict[str, Any]], int]:
+    """
+    Fetch one source's feed and prepare its items; runs on a fetch worker thread.
+    Returns: (parsed_feed, http_status, error_message, items, entries_seen)
+    """
+    d, http_status, fetch_error = fetch_feed_with_timeout(source["rss_url"], source["etag"], source["last_modified"])
+    items, seen = build_items(source["source_id"], d) if d is not None else ([], 0)
+    return d, http_status, fetch_error, items, seen
+
+
 def update_source_status(conn: sqlite3.Connection, source_id: str, fetch_utc: str, 
                          ok_utc: Optional[str], error: Optional[str], 
-                         http_status: Optional[int], items_seen: int, items_added: int) -> None:
+                         http_status: Optional[int], items_seen: int, items_added: int,
+                         etag: Optional[str] = None, last_modified: Optional[str] = None) -> None:
     """Update source_status table for a source."""
     conn.execute(
         """INSERT OR REPLACE INTO source_status
            (source_id, last_fetch_utc, last_ok_utc, last_error, last_http_status,
-            items_seen_last_fetch, items_added_last_fetch)
-           VALUES(?,?,?,?,?,?,?)""",
-        (source_id, fetch_utc, ok_utc, error, http_status, items_seen, items_added),
+            items_seen_last_fetch, items_added_last_fetch, etag, last_modified)
+           VALUES(?,?,?,?,?,?,?,?,?)""",
+        (source_id, fetch_utc, ok_utc, error, http_status, items_seen, items_added, etag, last_modified),
     )
 
 
-def fetch_once() -> None:
-    global _last_fetch_status
+def fetch_once(conn: Optional[sqlite3.Connection] = None) -> None:
+    """
+    Fetch all enabled feeds and store their new items.
+    Writes through ``conn`` if given (left open for reuse), otherwise opens
+    and closes a connection of its own.
+    """
+    global _last_fetch_status, _fetch_epoch
     added = 0
     err = None
     started = utils.utcnow()
     fetch_utc = started.isoformat()
-    conn = sqlite3.connect(db.DB_PATH, check_same_thread=False, timeout=30.0)
-    conn.row_factory = sqlite3.Row
-    # Ensure WAL mode is enabled for better concurrency (ignore errors in test/CI environments)
-    try:
-        conn.execute("PRAGMA journal_mode=WAL")
-    except sqlite3.OperationalError:
-        # WAL mode not supported or disk I/O error in test environment - continue anyway
-        pass
+    own_conn = conn is None
+    if conn is None:
+        conn = db.connect()
     try:
-        sources = conn.execute("SELECT * FROM sources WHERE enabled=1").fetchall()
-        for s in sources:
-            source_id = s["source_id"]
-            source_added = 0
-            source_seen = 0
-            source_error = None
-            source_http_status = None
-            source_ok_utc = None
-
-            # Fetch with timeout and retry
-            d, http_status, fetch_error = fetch_feed_with_timeout(s["rss_url"])
-            
-            if fetch_error:
-                source_error = fetch_error
-                source_http_status = http_status
-                update_source_status(
-                    conn, source_id, fetch_utc, source_ok_utc, 
-                    source_error, source_http_status, source_seen, source_added
-                )
-                conn.commit()  # Commit error status immediately
-                continue
-            
-            source_http_status = http_status
-            source_ok_utc = fetch_utc
-            
-            if getattr(d, "bozo", 0):
-                # RSS parse issues - log but continue
-                source_error = "RSS parse warning (bozo flag set)"
-            
-            for e in d.entries:
-                source_seen += 1
-                title = utils.normalize_ws(getattr(e, "title", "") or "")
-                url = getattr(e, "link", "") or ""
-                if not title or not url:
-                    continue
-                guid = getattr(e, "id", None) or getattr(e, "guid", None)
-                published = utils.parse_published(e)
-                item_id = utils.stable_item_id(source_id, title, url, guid)
-                fetched_at = utils.utcnow().isoformat()
-
-                topics = rules.tag_topics(title)
-                asset_classes = rules.tag_asset_class(title)
-                geo_tags = rules.tag_geo(title)
-                direction = rules.classify_direction(title)
-                urgency = rules.classify_urgency(title)
-                mode = rules.classify_mode(title)
-
-                item = dict(
-                    item_id=item_id,
-                    source_id=source_id,
-                    published_at=(published.isoformat() if published else None),
-                    fetched_at=fetched_at,
-                    title=title,
-                    url=url,
-                    guid=guid,
-                    summary=utils.normalize_ws(getattr(e, "summary", "") or "")[:1000] or None,
-                    raw_json=None,  # keep None v0; can store later if desired
-                    topics=topics,
-                    asset_classes=asset_classes,
-                    geo_tags=geo_tags,
-                    direction=direction,
-                    urgency=urgency,
-                    mode=mode,
-                    notes=None,
-                )
-
-                # detect whether it is new
-                cur = conn.execute("SELECT 1 FROM items WHERE item_id=?", (item_id,))
-                exists = cur.fetchone() is not None
-                db.upsert_item_and_annotations(conn, item)
-                if not exists:
-                    source_added += 1
-                    added += 1
-            
-            # Update source status after processing
-            update_source_status(
-                conn, source_id, fetch_utc, source_ok_utc, 
-                source_error, source_http_status, source_seen, source_added
-            )
-            
-            # Commit after each source to release locks sooner
-            conn.commit()
+        sources = conn.execute(
+            """SELECT s.*, ss.etag, ss.last_modified
+               FROM sources s
+               LEFT JOIN source_status ss ON ss.source_id = s.source_id
+               WHERE s.enabled=1"""
+        ).fetchall()
+        # Fetch, parse and tag feeds on worker threads; only the SQLite writes
+        # stay on this thread, so one source's commit overlaps the next
+        # source's preparation.
+        workers = max(1, min(FETCH_WORKERS, len(sources)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(fetch_and_build_items, s): s for s in sources}
+            for future in as_completed(futures):
+                s = futures[future]
+                source_id = s["source_id"]
+                source_added = 0
+                source_error = None
+                source_ok_utc = None
+                # Keep the stored validators unless a full response replaces them
+                source_etag = s["etag"]
+                source_last_modified = s["last_modified"]
+
+                d, source_http_status, fetch_error, items, source_seen = future.result()
+
+                if fetch_error:
+                    source_error = fetch_error
+                elif d is not None:
+                    source_ok_utc = fetch_utc
+                    source_etag = d.get("etag")
+                    source_last_modified = d.get("modified")
+
+                    if getattr(d, "bozo", 0):
+                        # RSS parse issues - log but continue
+                        source_error = "RSS parse warning (bozo flag set)"
+                else:
+                    # 304 Not Modified: nothing new to parse since the last fetch
+                    source_ok_utc = fetch_utc
+
+                # One transaction per source: the items and the source's status
+                # commit together, and locks are released before the next source
+                with conn:
+                    if items:
+                        source_added = db.upsert_items_and_annotations(conn, items)
+                        added += source_added
+                    update_source_status(
+                        conn, source_id, fetch_utc, source_ok_utc,
+                        source_error, source_http_status, source_seen, source_added,
+                        source_etag, source_last_modified
+                    )
     except Exception as ex:
         conn.rollback()
         err = f"{type(ex).__name__}: {ex}"
     finally:
-        conn.close()
+        if own_conn:
+            conn.close()
 
     _last_fetch_status = {
         "last_run_utc": started.isoformat(),
         "last_error": err,
         "items_added": added,
     }
+    _fetch_epoch += 1
+
+
+def fetch_loop(stop_event: threading.Event, fetch_interval_seconds: int, wake_event: threading.Event) -> None:
+    """
+    Fetch every ``fetch_interval_seconds``, or sooner when ``wake_event`` is set
+    (see request_fetch()), until ``stop_event`` is set (see stop_fetch_loop()).
+    """
+    # One writer connection for the worker's lifetime: connection setup and
+    # sqlite3's per-connection prepared-statement cache carry over between runs.
+    # Manual fetches run here too, so feed writes never compete for the lock.
+    conn = db.connect()
+    try:
+        # Do an initial fetch quickly so dashboard has data.
+        fetch_once(conn)
+        while not stop_event.is_set():
+            wake_event.wait(fetch_interval_seconds)
+            # Clear before fetching, not after: a request made mid-fetch may come
+            # after its feed was read, so it has to leave the event set for another run
+            wake_event.clear()
+            if stop_event.is_set():
+                break
+            fetch_once(conn)
+    finally:
+        conn.close()
 
 
-def fetch_loop(stop_event: threading.Event, fetch_interval_seconds: int) -> None:
-    # Do an initial fetch quickly so dashboard has data.
-    fetch_once()
-    while not stop_event.is_set():
-        stop_event.wait(fetch_interval_seconds)
-        if stop_event.is_set():
-            break
-        fetch_once()
+def request_fetch(wake_event: threading.Event) -> None:
+    """Ask the fetch_loop waiting on ``wake_event`` to fetch now instead of at its next interval."""
+    wake_event.set()
+
+
+def stop_fetch_loop(stop_event: threading.Event, wake_event: threading.Event) -> None:
+    """Stop a fetch_loop without waiting out its interval (it finishes any fetch in progress)."""
+    stop_event.set()
+    wake_event.set()
 
 
 def get_fetch_status() -> Dict[str, Any]:
     """Get the last fetch status."""
     return _last_fetch_status.copy()
+
+
+def get_fetch_epoch() -> int:
+    """Get the number of completed fetch runs (changes whenever new data may exist)."""
+    return _fetch_epoch
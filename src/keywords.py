@@ -0,0 +1,174 @@
+"""Aho-Corasick keyword prefilter for rule patterns.
+
+Most rule patterns are a literal keyword wrapped in ``\\b...\\b``. Scanning a
+title once for all of those keywords tells us which categories can possibly
+match, so the (much more expensive) regex only has to confirm the candidates.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Characters that end a literal run, and quantifiers that make the previous
+# character optional.
+_STOP = "()[].|^$+"
+_OPTIONAL = "?*{"
+
+# Non-ASCII characters that re.IGNORECASE treats as equal to an ASCII letter
+# but that str.lower() does not map onto it.
+_CASE_FOLD = str.maketrans({"İ": "i", "ı": "i", "ſ": "s"})
+
+
+def fold_case(text: str) -> str:
+    """Lowercase ``text`` so plain comparisons agree with re.IGNORECASE."""
+    return text.lower() if text.isascii() else text.translate(_CASE_FOLD).lower()
+
+
+def _split_alternatives(pattern: str) -> List[str]:
+    """Split a pattern on its top-level ``|`` operators."""
+    branches: List[str] = []
+    depth = 0
+    in_class = False
+    start = 0
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == "\\":
+            i += 2
+            continue
+        if in_class:
+            if c == "]":
+                in_class = False
+        elif c == "[":
+            in_class = True
+        elif c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        elif c == "|" and depth == 0:
+            branches.append(pattern[start:i])
+            start = i + 1
+        i += 1
+    branches.append(pattern[start:])
+    return branches
+
+
+def _leading_literal(branch: str) -> str:
+    """Return the literal text every match of ``branch`` must start with."""
+    i = 0
+    while branch.startswith("\\b", i) or branch.startswith("^", i):
+        i += 1 if branch[i] == "^" else 2
+
+    chars: List[str] = []
+    while i < len(branch):
+        c = branch[i]
+        if c == "\\":
+            escaped = branch[i + 1:i + 2]
+            if not escaped or escaped.isalnum():
+                break  # \b, \s, \d, ... are not literal text
+            step = 2
+            c = escaped
+        elif c in _STOP or c in _OPTIONAL:
+            break
+        else:
+            step = 1
+        if branch[i + step:i + step + 1] in ("?", "*", "{"):
+            break  # this character is optional
+        chars.append(c.lower())
+        i += step
+    return "".join(chars)
+
+
+def required_literals(pattern: str) -> Optional[List[str]]:
+    """
+    Return lowercase literals of which at least one occurs in every match.
+    Returns None if no such literal can be derived from the pattern.
+    """
+    literals = [_leading_literal(branch) for branch in _split_alternatives(pattern)]
+    if not all(literals):
+        return None
+    return literals
+
+
+class KeywordPrefilter:
+    """
+    Aho-Corasick automaton over the literal keywords of rule categories.
+
+    Each category registered with add() gets one bit; scan() returns the
+    bitmask of categories whose keywords occur in the text (case-insensitive).
+    Categories with a pattern that has no usable literal are always reported.
+    """
+
+    def __init__(self) -> None:
+        self._keywords: Dict[str, int] = {}
+        self._always = 0
+        self._next_bit = 1
+        self._delta: Optional[List[Dict[str, int]]] = None
+        self._out: List[int] = []
+        self._last: Tuple[Optional[str], int] = (None, 0)
+
+    def add(self, patterns: Iterable[str]) -> int:
+        """Register a category's patterns and return its bit."""
+        bit = self._next_bit
+        self._next_bit <<= 1
+        for p in patterns:
+            literals = required_literals(p)
+            if literals is None:
+                self._always |= bit
+                continue
+            for literal in literals:
+                self._keywords[literal] = self._keywords.get(literal, 0) | bit
+        self._delta = None
+        self._last = (None, 0)
+        return bit
+
+    def _build(self) -> List[Dict[str, int]]:
+        goto: List[Dict[str, int]] = [{}]
+        out: List[int] = [0]
+        for keyword, mask in self._keywords.items():
+            node = 0
+            for ch in keyword:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    goto.append({})
+                    out.append(0)
+                    nxt = goto[node][ch] = len(goto) - 1
+                node = nxt
+            out[node] |= mask
+
+        # Breadth-first failure links, folded into a full transition table
+        # so scanning never has to follow them.
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            delta[node] = {**delta[fail[node]], **goto[node]}
+            out[node] |= out[fail[node]]
+            for ch, child in goto[node].items():
+                fail[child] = delta[fail[node]].get(ch, 0)
+                queue.append(child)
+
+        self._out = out
+        self._delta = delta
+        return delta
+
+    def scan(self, text: str) -> int:
+        """Return the bitmask of categories that may match ``text``."""
+        return self.scan_folded(fold_case(text))
+
+    def scan_folded(self, folded: str) -> int:
+        """Like scan(), for text already passed through fold_case()."""
+        last_text, last_mask = self._last
+        if folded == last_text:
+            return last_mask
+        delta = self._delta or self._build()
+        out = self._out
+        node = 0
+        mask = self._always
+        for ch in folded:
+            node = delta[node].get(ch, 0)
+            mask |= out[node]
+        self._last = (folded, mask)
+        return mask
@@ -3,15 +3,23 @@
 from __future__ import annotations
 
 import re
-from typing import Dict, List
+import threading
+import functools
+from typing import Dict, Iterable, List, Optional, Pattern, Sequence, Tuple
 
+try:
+    import hyperscan
+except ImportError:  # optional; tagging falls back to the re matchers below
+    hyperscan = None
+
+from .keywords import KeywordPrefilter, fold_case
 # Import configurable rules system
-from .rules_config import load_topic_rules, load_asset_class_rules, load_geo_rules
+from .rules_config import Rules, load_topic_rules, load_asset_class_rules, load_geo_rules
 
 # Load rules from config files or use defaults
-TOPIC_RULES: Dict[str, List[str]] = load_topic_rules()
-ASSET_CLASS_RULES: Dict[str, List[str]] = load_asset_class_rules()
-GEO_RULES: Dict[str, List[str]] = load_geo_rules()
+TOPIC_RULES: Rules = load_topic_rules()
+ASSET_CLASS_RULES: Rules = load_asset_class_rules()
+GEO_RULES: Rules = load_geo_rules()
 
 NEG_CUES = [r"\bslump(s|ed)?\b", r"\bfall(s|ing)?\b", r"\bplunge(s|d)?\b", r"\bsell-?off\b",
             r"\bwarning\b", r"\brisk(s)?\b", r"\bcrisis\b", r"\bdefault(s|ed)?\b", r"\bdowngrade(s|d)?\b",
@@ -31,73 +39,222 @@ MODE_RULES = [
 ]
 
 
-def regex_any(patterns: List[str], text: str) -> bool:
-    return any(re.search(p, text, flags=re.IGNORECASE) for p in patterns)
+def compile_patterns(patterns: Iterable[str]) -> List[Pattern[str]]:
+    """Compile rule patterns case-insensitively, skipping invalid ones."""
+    compiled: List[Pattern[str]] = []
+    for p in patterns:
+        try:
+            compiled.append(re.compile(p, re.IGNORECASE))
+        except re.error as e:
+            print(f"Warning: Invalid rule pattern {p!r} ({e}), skipping")
+    return compiled
 
 
-def classify_direction(title: str) -> str:
-    t = title
-    has_neg = regex_any(NEG_CUES, t)
-    has_pos = regex_any(POS_CUES, t)
-    if has_neg and has_pos:
+# Never matches; stands in for a rule list with no usable patterns.
+_NEVER = re.compile(r"(?!)")
+
+
+def fold_pattern(pattern: str) -> str:
+    """Lowercase a pattern's literal characters, leaving escapes such as \\S or \\B intact."""
+    out: List[str] = []
+    i = 0
+    while i < len(pattern):
+        if pattern[i] == "\\":
+            out.append(pattern[i:i + 2])
+            i += 2
+        else:
+            out.append(fold_case(pattern[i]))
+            i += 1
+    return "".join(out)
+
+
+def fuse_patterns(patterns: Iterable[str]) -> Pattern[str]:
+    """
+    Fuse rule patterns into a single alternation for case-folded text.
+    The result is compiled without re.IGNORECASE (which makes the regex engine
+    fold every character it compares), so search fold_case(text) with it.
+    """
+    patterns = list(patterns)
+    if patterns:
+        # Compiling the fused alternation checks every pattern in one go; rule
+        # lists are almost always valid, so only validate one by one on error
+        try:
+            return re.compile("|".join(f"(?:{fold_pattern(p)})" for p in patterns))
+        except re.error:
+            pass
+    valid = [p.pattern for p in compile_patterns(patterns)]
+    if not valid:
+        return _NEVER
+    return re.compile("|".join(f"(?:{fold_pattern(p)})" for p in valid))
+
+
+# (name, fused pattern, prefilter bit) for every category of every rule set.
+# Compiled once at import; the *_RULES tables above stay the source of truth
+# (e.g. for seeding the tags table).
+Matcher = Tuple[str, Pattern[str], int]
+
+_PREFILTER = KeywordPrefilter()
+
+
+def _matchers(rules: Iterable[Tuple[str, Sequence[str]]]) -> List[Matcher]:
+    return [(name, fuse_patterns(pats), _PREFILTER.add(pats)) for name, pats in rules]
+
+
+TOPIC_MATCHERS = _matchers(TOPIC_RULES.items())
+ASSET_CLASS_MATCHERS = _matchers(ASSET_CLASS_RULES.items())
+GEO_MATCHERS = _matchers(GEO_RULES.items())
+DIRECTION_MATCHERS = _matchers([("neg", NEG_CUES), ("pos", POS_CUES)])
+URGENCY_MATCHERS = _matchers([("high", URG_HIGH), ("med", URG_MED)])
+MODE_MATCHERS = _matchers(MODE_RULES)
+
+
+# Result key and rules for every category apply_all_tagging() reports
+_TAGGING_RULES: List[Tuple[str, Iterable[Tuple[str, Sequence[str]]]]] = [
+    ("topics", TOPIC_RULES.items()),
+    ("asset_classes", ASSET_CLASS_RULES.items()),
+    ("geo_tags", GEO_RULES.items()),
+    ("direction", [("neg", NEG_CUES), ("pos", POS_CUES)]),
+    ("urgency", [("high", URG_HIGH), ("med", URG_MED)]),
+    ("mode", MODE_RULES),
+]
+
+
+def build_hyperscan_database():
+    """
+    Compile every rule into one Hyperscan database, so a title is tagged by a
+    single DFA scan. Returns (database, categories), where categories maps an
+    expression id to its (result key, category name), or None if Hyperscan is
+    unavailable or rejects a pattern. Hyperscan has no Unicode-aware \b, so rule
+    sets that use it stay on re rather than tagging differently.
+    """
+    if hyperscan is None:
+        return None
+    categories: List[Tuple[str, str]] = []
+    expressions: List[bytes] = []
+    ids: List[int] = []
+    for key, rules in _TAGGING_RULES:
+        for name, patterns in rules:
+            for pattern in patterns:
+                # Skip what compile_patterns() would skip
+                try:
+                    re.compile(pattern)
+                except re.error:
+                    continue
+                expressions.append(fold_pattern(pattern).encode("utf-8"))
+                ids.append(len(categories))
+            categories.append((key, name))
+    database = hyperscan.Database()
+    try:
+        # Patterns and text are case-folded like the re path; UCP makes \w and
+        # friends Unicode-aware as they are in re, so both backends tag identically
+        database.compile(
+            expressions=expressions,
+            ids=ids,
+            elements=len(expressions),
+            flags=[hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP] * len(expressions),
+        )
+    except hyperscan.error as e:
+        print(f"Warning: Hyperscan could not compile the tagging rules, using re instead: {e}")
+        return None
+    return database, categories
+
+
+_HYPERSCAN = build_hyperscan_database()
+_hyperscan_local = threading.local()
+
+
+def _collect_match(expression_id: int, start: int, end: int, flags: int, hits: List[int]) -> None:
+    hits.append(expression_id)
+
+
+def _hyperscan_tagging(text: str) -> Dict[str, List[str]]:
+    database, categories = _HYPERSCAN
+    # Scratch space may not be shared between threads scanning at the same time
+    scratch = getattr(_hyperscan_local, "scratch", None)
+    if scratch is None:
+        scratch = _hyperscan_local.scratch = hyperscan.Scratch(database)
+    hits: List[int] = []
+    database.scan(text.encode("utf-8"), match_event_handler=_collect_match, context=hits, scratch=scratch)
+
+    result: Dict[str, List[str]] = {key: [] for key, _ in _TAGGING_RULES}
+    # Category ids follow rule order, so sorted hits keep match_all()'s ordering
+    for category_id in sorted(set(hits)):
+        key, name = categories[category_id]
+        result[key].append(name)
+    result["direction"] = _direction(result["direction"])
+    result["urgency"] = result["urgency"][0] if result["urgency"] else "low"
+    result["mode"] = result["mode"][0] if result["mode"] else "unknown"
+    return result
+
+
+def match_all(matchers: List[Matcher], text: str) -> List[str]:
+    """Return the names of all categories matching fold_case()d ``text``, in rule order."""
+    candidates = _PREFILTER.scan_folded(text)
+    return [name for name, pattern, bit in matchers if candidates & bit and pattern.search(text)]
+
+
+def match_first(matchers: List[Matcher], text: str) -> Optional[str]:
+    """Return the name of the first category matching fold_case()d ``text``, if any."""
+    candidates = _PREFILTER.scan_folded(text)
+    for name, pattern, bit in matchers:
+        if candidates & bit and pattern.search(text):
+            return name
+    return None
+
+
+def _direction(hits: List[str]) -> str:
+    if len(hits) == 2:
         return "mixed"
-    if has_neg:
-        return "neg"
-    if has_pos:
-        return "pos"
-    return "neutral"
+    return hits[0] if hits else "neutral"
+
+
+def classify_direction(title: str) -> str:
+    return _direction(match_all(DIRECTION_MATCHERS, fold_case(title)))
 
 
 def classify_urgency(title: str) -> str:
-    t = title
-    if regex_any(URG_HIGH, t):
-        return "high"
-    if regex_any(URG_MED, t):
-        return "med"
-    return "low"
+    return match_first(URGENCY_MATCHERS, fold_case(title)) or "low"
 
 
 def classify_mode(title: str) -> str:
-    t = title
-    for mode, pats in MODE_RULES:
-        if regex_any(pats, t):
-            return mode
-    return "unknown"
+    return match_first(MODE_MATCHERS, fold_case(title)) or "unknown"
 
 
 def tag_topics(title: str) -> List[str]:
-    hits: List[str] = []
-    for tag, pats in TOPIC_RULES.items():
-        if regex_any(pats, title):
-            hits.append(tag)
-    return hits
+    return match_all(TOPIC_MATCHERS, fold_case(title))
 
 
 def tag_asset_class(title: str) -> List[str]:
     """Tag asset classes based on title content."""
-    hits: List[str] = []
-    for tag, pats in ASSET_CLASS_RULES.items():
-        if regex_any(pats, title):
-            hits.append(tag)
-    return hits
+    return match_all(ASSET_CLASS_MATCHERS, fold_case(title))
 
 
 def tag_geo(title: str) -> List[str]:
     """Tag geographic regions based on title content."""
-    hits: List[str] = []
-    for tag, pats in GEO_RULES.items():
-        if regex_any(pats, title):
-            hits.append(tag)
-    return hits
+    return match_all(GEO_MATCHERS, fold_case(title))
 
 
-def apply_all_tagging(title: str) -> Dict[str, List[str]]:
-    """Apply all tagging rules and return results."""
+# Feeds re-list the same headlines every fetch and syndicate each other's, so
+# most titles seen by a fetch cycle have been tagged before
+TAGGING_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=TAGGING_CACHE_SIZE)
+def _tag_folded(text: str) -> Dict[str, List[str]]:
+    if _HYPERSCAN is not None:
+        return _hyperscan_tagging(text)
     return {
-        "topics": tag_topics(title),
-        "asset_classes": tag_asset_class(title),
-        "geo_tags": tag_geo(title),
-        "direction": classify_direction(title),
-        "urgency": classify_urgency(title),
-        "mode": classify_mode(title),
+        "topics": match_all(TOPIC_MATCHERS, text),
+        "asset_classes": match_all(ASSET_CLASS_MATCHERS, text),
+        "geo_tags": match_all(GEO_MATCHERS, text),
+        "direction": _direction(match_all(DIRECTION_MATCHERS, text)),
+        "urgency": match_first(URGENCY_MATCHERS, text) or "low",
+        "mode": match_first(MODE_MATCHERS, text) or "unknown",
     }
+
+
+def apply_all_tagging(title: str) -> Dict[str, List[str]]:
+    """Apply all tagging rules and return results (the title is case-folded once)."""
+    tags = _tag_folded(fold_case(title))
+    # Hand out fresh lists so callers can't alter the cached result
+    return {key: list(value) if isinstance(value, list) else value for key, value in tags.items()}
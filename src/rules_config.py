@@ -8,10 +8,21 @@ from __future__ import annotations
 import json
 import os
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+# A rule set maps each tag to its patterns: lists when loaded from a config
+# file, tuples in the read-only defaults below
+Rules = Mapping[str, Sequence[str]]
+
+
+def _freeze(rules: Dict[str, List[str]]) -> Rules:
+    """Make a default rule set read-only, so callers can share it without copying."""
+    return MappingProxyType({tag: tuple(patterns) for tag, patterns in rules.items()})
+
 
 # Default fallback rules (same as hardcoded rules in rules.py)
-DEFAULT_TOPIC_RULES = {
+DEFAULT_TOPIC_RULES = _freeze({
     "rates": [r"\brate(s)?\b", r"\byield(s)?\b", r"\btreasur(y|ies)\b", r"\b10-?year\b", r"\b2-?year\b"],
     "inflation": [r"\binflation\b", r"\bCPI\b", r"\bPCE\b", r"\bprice(s)?\b"],
     "fed": [r"\bFed\b", r"\bFOMC\b", r"\bPowell\b", r"\bcentral bank\b"],
@@ -37,23 +48,23 @@ DEFAULT_TOPIC_RULES = {
     "startups": [r"\bstartup(s)?\b", r"\bVC\b", r"\bventure capital\b", r"\bfounder(s)?\b", r"\bunicorn(s)?\b"],
     "investors": [r"\binvestor(s)?\b", r"\bhedge fund(s)?\b", r"\bprivate equity\b", r"\bPE\b"],
     "markets": [r"\bmarket(s)?\b", r"\btrading\b", r"\bNYSE\b", r"\bNASDAQ\b"],
-}
+})
 
-DEFAULT_ASSET_CLASS_RULES = {
+DEFAULT_ASSET_CLASS_RULES = _freeze({
     "equities": [r"\bstocks?\b", r"\bequities?\b", r"\bshares?\b", r"\bSPY\b", r"\bQQQ\b", r"\bDIA\b", r"\bS&P\b", r"\bNasdaq\b", r"\bDow\b"],
     "rates": [r"\bbonds?\b", r"\bfixed income\b", r"\btreasur(y|ies)\b", r"\byield(s)?\b", r"\bTLT\b", r"\bIEF\b", r"\bAGG\b"],
     "credit": [r"\bcredit\b", r"\bcorporate bonds?\b", r"\bhigh yield\b", r"\bjunk bonds?\b", r"\bLQD\b", r"\bHYG\b"],
     "fx": [r"\bcurrency\b", r"\bforex\b", r"\bFX\b", r"\bdollar\b", r"\beuro\b", r"\byen\b", r"\bpound\b", r"\bEURUSD\b", r"\bGBPUSD\b"],
     "commodities": [r"\bcommodit(y|ies)\b", r"\bgold\b", r"\bsilver\b", r"\bcopper\b", r"\boil\b", r"\bWTI\b", r"\bBrent\b", r"\bGLD\b", r"\bSLV\b"],
-}
+})
 
-DEFAULT_GEO_RULES = {
+DEFAULT_GEO_RULES = _freeze({
     "US": [r"\bUS\b", r"\bUnited States\b", r"\bAmerica\b", r"\bUS economy\b", r"\bFederal Reserve\b", r"\bFOMC\b"],
     "Europe": [r"\bEurope\b", r"\bEU\b", r"\bEurozone\b", r"\bECB\b", r"\bEuropean Central Bank\b", r"\bGermany\b", r"\bFrance\b"],
     "China": [r"\bChina\b", r"\bBeijing\b", r"\bShanghai\b", r"\bHong Kong\b", r"\byuan\b", r"\bPBOC\b"],
     "Global": [r"\bglobal\b", r"\bworldwide\b", r"\binternational\b", r"\bG7\b", r"\bG20\b", r"\bIMF\b", r"\bWorld Bank\b"],
     "EM": [r"\bemerging markets?\b", r"\bdeveloping countries\b", r"\bBRICS\b", r"\bBrazil\b", r"\bRussia\b", r"\bIndia\b", r"\bSouth Africa\b"],
-}
+})
 
 def load_rules_from_file(file_path: str) -> Optional[Dict[str, Any]]:
     """Load rules from a JSON file. Returns None if file doesn't exist or is invalid."""
@@ -67,75 +78,46 @@ def get_config_dir() -> Path:
     """Get the configuration directory path."""
     # Look for config directory relative to the src directory
     src_dir = Path(__file__).parent
-    config_dir = src_dir.parent / "config"
-
-    # Create config directory if it doesn't exist
-    config_dir.mkdir(exist_ok=True)
-    return config_dir
-
-def load_topic_rules() -> Dict[str, List[str]]:
+    return src_dir.parent / "config"
+
+def _load_rules(filename: str, label: str, default: Rules) -> Rules:
+    """Load a rule set from the config directory, keeping only valid entries, or return ``default``."""
+    config = load_rules_from_file(str(get_config_dir() / filename))
+    # Validate that it's a dict of lists of pattern strings
+    if not config or not isinstance(config, dict):
+        return default
+
+    validated = {}
+    for key, value in config.items():
+        if isinstance(value, list) and all(isinstance(item, str) for item in value):
+            validated[key] = value
+        else:
+            print(f"Warning: Invalid {label} rule for '{key}', using default")
+    return validated or default
+
+def load_topic_rules() -> Rules:
     """Load topic rules from config file or use defaults."""
-    config_dir = get_config_dir()
-    config_file = config_dir / "topics.json"
-
-    config = load_rules_from_file(str(config_file))
-    if config:
-        # Validate that it's a dict of lists
-        if isinstance(config, dict):
-            validated = {}
-            for key, value in config.items():
-                if isinstance(value, list) and all(isinstance(item, str) for item in value):
-                    validated[key] = value
-                else:
-                    print(f"Warning: Invalid topic rule for '{key}', using default")
-            if validated:
-                return validated
-
-    return DEFAULT_TOPIC_RULES
-
-def load_asset_class_rules() -> Dict[str, List[str]]:
+    return _load_rules("topics.json", "topic", DEFAULT_TOPIC_RULES)
+
+def load_asset_class_rules() -> Rules:
     """Load asset class rules from config file or use defaults."""
-    config_dir = get_config_dir()
-    config_file = config_dir / "asset_classes.json"
-
-    config = load_rules_from_file(str(config_file))
-    if config:
-        # Validate format
-        if isinstance(config, dict):
-            validated = {}
-            for key, value in config.items():
-                if isinstance(value, list) and all(isinstance(item, str) for item in value):
-                    validated[key] = value
-                else:
-                    print(f"Warning: Invalid asset class rule for '{key}', using default")
-            if validated:
-                return validated
-
-    return DEFAULT_ASSET_CLASS_RULES
-
-def load_geo_rules() -> Dict[str, List[str]]:
+    return _load_rules("asset_classes.json", "asset class", DEFAULT_ASSET_CLASS_RULES)
+
+def load_geo_rules() -> Rules:
     """Load geographic rules from config file or use defaults."""
-    config_dir = get_config_dir()
-    config_file = config_dir / "geo.json"
-
-    config = load_rules_from_file(str(config_file))
-    if config:
-        # Validate format
-        if isinstance(config, dict):
-            validated = {}
-            for key, value in config.items():
-                if isinstance(value, list) and all(isinstance(item, str) for item in value):
-                    validated[key] = value
-                else:
-                    print(f"Warning: Invalid geo rule for '{key}', using default")
-            if validated:
-                return validated
-
-    return DEFAULT_GEO_RULES
+    return _load_rules("geo.json", "geo", DEFAULT_GEO_RULES)
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write JSON to ``path`` via a temporary file so a crash never leaves a partial file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    os.replace(tmp_path, path)
 
 def create_example_configs():
     """Create example configuration files for reference."""
     config_dir = get_config_dir()
+    # Loading rules only reads; this is the one place that writes the directory
+    config_dir.mkdir(exist_ok=True)
 
     # Create example topic rules
     example_topics = {
@@ -144,8 +126,7 @@ def create_example_configs():
         "custom_topic": [r"\bcustom keyword\b"]
     }
 
-    with open(config_dir / "topics_example.json", 'w') as f:
-        json.dump(example_topics, f, indent=2)
+    _write_json(config_dir / "topics_example.json", example_topics)
 
     # Create example asset class rules
     example_assets = {
@@ -153,8 +134,7 @@ def create_example_configs():
         "custom_asset": [r"\bcustom asset\b"]
     }
 
-    with open(config_dir / "asset_classes_example.json", 'w') as f:
-        json.dump(example_assets, f, indent=2)
+    _write_json(config_dir / "asset_classes_example.json", example_assets)
 
     print(f"Created example config files in {config_dir}")
     print("Rename _example.json files to .json to use them")
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
+import calendar
 import hashlib
-import re
-import time
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any, Optional
 
 from dateutil import parser as dtparser
@@ -15,41 +15,70 @@ def utcnow() -> datetime:
     return datetime.now(timezone.utc)
 
 
+# Publisher suffixes stripped from titles before hashing, in this order.
+# Titles are whitespace-normalized first, so a plain suffix check matches
+# exactly what r"\s+-\s+<publisher>$" used to.
+TITLE_HASH_SUFFIXES = (" - reuters", " - bloomberg", " - financial times", " - the economist", " - wsj")
+
+
 def normalize_ws(s: str) -> str:
-    return re.sub(r"\s+", " ", s).strip()
+    # Most titles are already normalized. isprintable() is False for every
+    # whitespace character except the plain space, so this check is exact.
+    if s.isprintable() and "  " not in s and not s.startswith(" ") and not s.endswith(" "):
+        return s
+    # str.split() splits on the same characters as r"\s+"
+    return " ".join(s.split())
 
 
 def normalize_title_for_hash(title: str, source_id: str) -> str:
-    t = title.lower()
-    t = normalize_ws(t)
+    t = normalize_ws(title.lower())
     # light, safe stripping of common suffix patterns
     # per-source exceptions can be added later
-    t = re.sub(r"\s+-\s+reuters$", "", t)
-    t = re.sub(r"\s+-\s+bloomberg$", "", t)
-    t = re.sub(r"\s+-\s+financial times$", "", t)
-    t = re.sub(r"\s+-\s+the economist$", "", t)
-    t = re.sub(r"\s+-\s+wsj$", "", t)
+    for suffix in TITLE_HASH_SUFFIXES:
+        if t.endswith(suffix):
+            t = t[:-len(suffix)]
     return t
 
 
 def stable_item_id(source_id: str, title: str, url: str, guid: Optional[str]) -> str:
+    # item_id is the persisted dedup key: changing the digest or the
+    # normalization would re-insert every item still present in a feed.
     base = guid or f"{source_id}|{normalize_title_for_hash(title, source_id)}|{url}"
     return hashlib.sha256(base.encode("utf-8")).hexdigest()
 
 
+def _parse_date_string(value: str) -> datetime:
+    # RSS dates are RFC 2822 and Atom dates ISO 8601; both have fast stdlib
+    # parsers, so only unusual formats reach dateutil's heuristic parser.
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        pass
+    return dtparser.parse(value)
+
+
 def parse_published(entry: Any) -> Optional[datetime]:
-    # feedparser sometimes provides published_parsed; we also accept published/updated strings
+    # feedparser entries are dicts; fall back to attributes for other objects
+    get = entry.get if hasattr(entry, "get") else lambda key: getattr(entry, key, None)
+    # feedparser already parsed the date fields into UTC struct_times
+    for key in ("published_parsed", "updated_parsed", "created_parsed"):
+        parsed = get(key)
+        if parsed:
+            try:
+                return datetime.fromtimestamp(calendar.timegm(parsed), tz=timezone.utc)
+            except (OverflowError, TypeError, ValueError):
+                pass
+    # otherwise accept the raw published/updated/created strings
     for key in ("published", "updated", "created"):
-        if getattr(entry, key, None):
+        value = get(key)
+        if value:
             try:
-                dt = dtparser.parse(getattr(entry, key))
+                dt = _parse_date_string(value)
                 return dt.astimezone(timezone.utc) if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
             except Exception:
                 pass
-    # published_parsed as struct_time
-    if getattr(entry, "published_parsed", None):
-        try:
-            return datetime.fromtimestamp(time.mktime(entry.published_parsed), tz=timezone.utc)
-        except Exception:
-            pass
     return None
@@ -2,1238 +2,264 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import json
+import os
 import sqlite3
 import threading
+import time
+import zlib
+from collections import OrderedDict
 from datetime import timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
-from flask import Flask, Response, g, redirect, render_template_string, request, url_for
+from flask import Flask, Response, redirect, render_template, request, stream_template, url_for
 
 from . import db, ingest, rules, utils
 
-TEMPLATE = """
-<!doctype html>
-<html lang="en">
-<head>
-  <meta charset="utf-8" />
-  <meta name="viewport" content="width=device-width,initial-scale=1" />
-  <title>{{ title }}</title>
-  <script src="https://cdn.tailwindcss.com"></script>
-  <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0"></script>
-  <style>
-    :root {
-      /* Modern Color Palette */
-      --bg-primary: #0a0a0a;
-      --bg-secondary: #111111;
-      --bg-tertiary: #1a1a1a;
-      --bg-card: linear-gradient(135deg, #1a1a1a 0%, #0f0f0f 100%);
-      --bg-card-hover: linear-gradient(135deg, #202020 0%, #141414 100%);
-
-      --border-primary: #2a2a2a;
-      --border-secondary: #333333;
-      --border-accent: #3b82f6;
-
-      --text-primary: #f8fafc;
-      --text-secondary: #cbd5e1;
-      --text-muted: #94a3b8;
-
-      --accent-blue: #3b82f6;
-      --accent-blue-hover: #2563eb;
-      --accent-green: #10b981;
-      --accent-red: #ef4444;
-      --accent-orange: #f59e0b;
-
-      /* Shadows */
-      --shadow-sm: 0 1px 2px 0 rgb(0 0 0 / 0.25);
-      --shadow-md: 0 4px 6px -1px rgb(0 0 0 / 0.3), 0 2px 4px -2px rgb(0 0 0 / 0.3);
-      --shadow-lg: 0 10px 15px -3px rgb(0 0 0 / 0.4), 0 4px 6px -4px rgb(0 0 0 / 0.4);
-
-      /* Typography */
-      --font-mono: ui-monospace, SFMono-Regular, "SF Mono", Monaco, Consolas, "Liberation Mono", "Courier New", monospace;
-
-      /* Animations */
-      --transition-fast: 150ms cubic-bezier(0.4, 0, 0.2, 1);
-      --transition-normal: 250ms cubic-bezier(0.4, 0, 0.2, 1);
-      --transition-slow: 350ms cubic-bezier(0.4, 0, 0.2, 1);
-    }
-
-    /* Modern scrollbar */
-    ::-webkit-scrollbar {
-      width: 8px;
-      height: 8px;
-    }
-
-    ::-webkit-scrollbar-track {
-      background: var(--bg-secondary);
-    }
-
-    ::-webkit-scrollbar-thumb {
-      background: var(--border-primary);
-      border-radius: 4px;
-    }
-
-    ::-webkit-scrollbar-thumb:hover {
-      background: var(--border-secondary);
-    }
-
-    /* Mobile-first responsive improvements */
-    @media (max-width: 768px) {
-      .modern-card {
-        border-radius: 12px;
-        padding: 1rem;
-      }
-
-      .modern-card:hover {
-        transform: none; /* Disable hover transforms on mobile */
-      }
-
-      .modern-table {
-        font-size: 12px;
-      }
-
-      .modern-table th,
-      .modern-table td {
-        padding: 8px 12px;
-      }
-
-      /* Stack filter controls vertically on mobile */
-      .filter-controls {
-        flex-direction: column;
-        gap: 1rem;
-      }
-
-      .filter-controls .modern-select,
-      .filter-controls .modern-input {
-        width: 100%;
-      }
-
-      /* Improve badge layout on mobile */
-      .badge {
-        font-size: 10px;
-        padding: 3px 6px;
-      }
-
-      /* Better spacing for news items on mobile */
-      .news-item-mobile {
-        padding: 1rem;
-        margin-bottom: 0.5rem;
-        border-radius: 8px;
-      }
-    }
-
-    @media (max-width: 640px) {
-      /* Hide less critical information on very small screens */
-      .mobile-hidden {
-        display: none;
-      }
-
-      /* Simplify header on mobile */
-      .mobile-header-simplified h1 {
-        font-size: 1.5rem;
-      }
-
-      .mobile-header-simplified .filter-controls {
-        flex-direction: column;
-        gap: 0.5rem;
-      }
-
-      /* Stack grid items vertically on mobile */
-      .mobile-grid-stack {
-        grid-template-columns: 1fr;
-      }
-    }
-
-    /* Loading skeleton enhancements */
-    .skeleton-card {
-      background: var(--bg-card);
-      border: 1px solid var(--border-primary);
-      border-radius: 16px;
-      padding: 1.5rem;
-      animation: pulse 2s cubic-bezier(0.4, 0, 0.6, 1) infinite;
-    }
-
-    .skeleton-text {
-      background: var(--bg-tertiary);
-      border-radius: 4px;
-      height: 1rem;
-      margin-bottom: 0.5rem;
-    }
-
-    .skeleton-text:last-child {
-      margin-bottom: 0;
-      width: 60%;
-    }
-
-    .skeleton-chart {
-      background: var(--bg-tertiary);
-      border-radius: 8px;
-      height: 120px;
-      animation: loading 1.5s infinite;
-    }
-
-    /* Enhanced focus states for accessibility */
-    .focus-ring:focus {
-      outline: none;
-      box-shadow: 0 0 0 3px rgb(59 130 246 / 0.5);
-    }
-
-    /* Improved button loading states */
-    .btn-loading {
-      opacity: 0.7;
-      cursor: not-allowed;
-    }
-
-    .btn-loading::after {
-      content: "";
-      display: inline-block;
-      width: 1rem;
-      height: 1rem;
-      border: 2px solid transparent;
-      border-top: 2px solid currentColor;
-      border-radius: 50%;
-      animation: spin 1s linear infinite;
-      margin-left: 0.5rem;
-    }
-
-    @keyframes spin {
-      to { transform: rotate(360deg); }
-    }
-
-    /* Loading animation */
-    @keyframes pulse {
-      0%, 100% { opacity: 1; }
-      50% { opacity: 0.5; }
-    }
-
-    .animate-pulse {
-      animation: pulse 2s cubic-bezier(0.4, 0, 0.6, 1) infinite;
-    }
-
-    /* Fade in animation */
-    @keyframes fadeIn {
-      from { opacity: 0; transform: translateY(10px); }
-      to { opacity: 1; transform: translateY(0); }
-    }
-
-    .animate-fade-in {
-      animation: fadeIn 0.5s ease-out;
-    }
-
-    /* Modern card styles */
-    .modern-card {
-      background: var(--bg-card);
-      border: 1px solid var(--border-primary);
-      border-radius: 16px;
-      box-shadow: var(--shadow-sm);
-      transition: all var(--transition-normal);
-    }
-
-    .modern-card:hover {
-      background: var(--bg-card-hover);
-      border-color: var(--border-secondary);
-      box-shadow: var(--shadow-md);
-      transform: translateY(-2px);
-    }
-
-    /* Modern button styles */
-    .btn-primary {
-      background: linear-gradient(135deg, var(--accent-blue) 0%, var(--accent-blue-hover) 100%);
-      border: none;
-      border-radius: 12px;
-      color: white;
-      font-weight: 500;
-      padding: 8px 16px;
-      transition: all var(--transition-fast);
-      box-shadow: var(--shadow-sm);
-    }
-
-    .btn-primary:hover {
-      transform: translateY(-1px);
-      box-shadow: var(--shadow-md);
-    }
-
-    .btn-secondary {
-      background: var(--bg-tertiary);
-      border: 1px solid var(--border-primary);
-      border-radius: 12px;
-      color: var(--text-secondary);
-      font-weight: 500;
-      padding: 8px 16px;
-      transition: all var(--transition-fast);
-    }
-
-    .btn-secondary:hover {
-      background: var(--bg-secondary);
-      border-color: var(--border-secondary);
-      color: var(--text-primary);
-    }
-
-    /* Modern form styles */
-    .modern-select, .modern-input {
-      background: var(--bg-secondary);
-      border: 1px solid var(--border-primary);
-      border-radius: 12px;
-      color: var(--text-primary);
-      padding: 8px 12px;
-      transition: all var(--transition-fast);
-      font-size: 14px;
-    }
-
-    .modern-select:focus, .modern-input:focus {
-      outline: none;
-      border-color: var(--accent-blue);
-      box-shadow: 0 0 0 3px rgb(59 130 246 / 0.1);
-    }
-
-    /* Modern table styles */
-    .modern-table {
-      width: 100%;
-      border-collapse: separate;
-      border-spacing: 0;
-    }
-
-    .modern-table th {
-      background: var(--bg-tertiary);
-      color: var(--text-secondary);
-      font-weight: 600;
-      font-size: 12px;
-      text-transform: uppercase;
-      letter-spacing: 0.05em;
-      padding: 12px 16px;
-      text-align: left;
-      border-bottom: 1px solid var(--border-primary);
-    }
-
-    .modern-table td {
-      padding: 12px 16px;
-      border-bottom: 1px solid var(--border-primary);
-      transition: background-color var(--transition-fast);
-    }
-
-    .modern-table tbody tr:hover td {
-      background: rgba(59, 130, 246, 0.05);
-    }
-
-    .modern-table tbody tr:nth-child(even) td {
-      background: rgba(255, 255, 255, 0.01);
-    }
-
-    /* Status badges */
-    .badge {
-      display: inline-flex;
-      align-items: center;
-      gap: 6px;
-      padding: 4px 8px;
-      border-radius: 8px;
-      font-size: 11px;
-      font-weight: 500;
-      text-transform: uppercase;
-      letter-spacing: 0.05em;
-    }
-
-    .badge-positive { background: rgba(16, 185, 129, 0.1); color: var(--accent-green); border: 1px solid rgba(16, 185, 129, 0.2); }
-    .badge-negative { background: rgba(239, 68, 68, 0.1); color: var(--accent-red); border: 1px solid rgba(239, 68, 68, 0.2); }
-    .badge-neutral { background: rgba(148, 163, 184, 0.1); color: var(--text-muted); border: 1px solid rgba(148, 163, 184, 0.2); }
-    .badge-mixed { background: rgba(245, 158, 11, 0.1); color: var(--accent-orange); border: 1px solid rgba(245, 158, 11, 0.2); }
-
-    .badge-asset { background: rgba(16, 185, 129, 0.1); color: var(--accent-green); border: 1px solid rgba(16, 185, 129, 0.2); }
-    .badge-geo { background: rgba(59, 130, 246, 0.1); color: #60a5fa; border: 1px solid rgba(59, 130, 246, 0.2); }
-
-    /* Loading skeleton */
-    .skeleton {
-      background: linear-gradient(90deg, var(--bg-tertiary) 25%, var(--bg-secondary) 50%, var(--bg-tertiary) 75%);
-      background-size: 200% 100%;
-      animation: loading 1.5s infinite;
-    }
-
-    @keyframes loading {
-      0% { background-position: 200% 0; }
-      100% { background-position: -200% 0; }
-    }
-  </style>
-</head>
-<body class="bg-[var(--bg-primary)] text-[var(--text-primary)] animate-fade-in">
-  <div class="max-w-7xl mx-auto p-4 md:p-8">
-    <div class="flex flex-col md:flex-row md:items-end md:justify-between gap-4 animate-fade-in">
-      <div>
-        <h1 class="text-3xl md:text-4xl font-bold bg-gradient-to-r from-white to-slate-300 bg-clip-text text-transparent">{{ title }}</h1>
-        <div class="text-[var(--text-secondary)] mt-2 text-sm flex items-center gap-4">
-          <span class="flex items-center gap-2">
-            <div class="w-2 h-2 bg-[var(--accent-blue)] rounded-full"></div>
-            Lookback: <span class="font-semibold text-[var(--text-primary)]">{{ lookback_hours }}h</span>
-          </span>
-          {% if category %}
-            <span class="flex items-center gap-2">
-              <div class="w-2 h-2 bg-[var(--accent-green)] rounded-full"></div>
-              Category: <span class="font-semibold text-[var(--text-primary)]">{{ category }}</span>
-            </span>
-          {% endif %}
-          {% if topic %}
-            <span class="flex items-center gap-2">
-              <div class="w-2 h-2 bg-[var(--accent-orange)] rounded-full"></div>
-              Topic: <span class="font-semibold text-[var(--text-primary)]">{{ topic }}</span>
-            </span>
-          {% endif %}
-        </div>
-      </div>
-      <div class="flex flex-wrap gap-3 items-center">
-        <a class="btn-secondary text-sm" href="{{ url_for('fetch_now') }}">
-          <span class="flex items-center gap-2">
-            <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-              <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M4 4v5h.582m15.356 2A8.001 8.001 0 004.582 9m0 0H9m11 11v-5h-.581m0 0a8.003 8.003 0 01-15.357-2m15.357 2H15"></path>
-            </svg>
-            Fetch now
-          </span>
-        </a>
-        <form method="get" class="flex flex-wrap gap-3 items-center">
-          <select name="lookback" class="modern-select text-sm">
-            {% for h in [6,12,24,48,72,168] %}
-              <option value="{{h}}" {% if h==lookback_hours %}selected{% endif %}>{{h}}h</option>
-            {% endfor %}
-          </select>
-          <select name="category" class="modern-select text-sm">
-            <option value="">All categories</option>
-            <option value="A" {% if "A"==category %}selected{% endif %}>📈 Market News</option>
-            <option value="B" {% if "B"==category %}selected{% endif %}>📰 Interpretive/Opinion</option>
-            <option value="C" {% if "C"==category %}selected{% endif %}>🏛️ Macro/Policy Anchors</option>
-            <option value="D" {% if "D"==category %}selected{% endif %}>💼 Practitioner Commentary</option>
-            <option value="E" {% if "E"==category %}selected{% endif %}>📊 Other</option>
-          </select>
-          <input name="topic" value="{{ topic or '' }}" placeholder="topic tag (e.g., rates)" class="modern-input text-sm w-56" />
-          <button class="btn-primary text-sm font-medium" type="submit">
-            <span class="flex items-center gap-2">
-              <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M3 4a1 1 0 011-1h16a1 1 0 011 1v2.586a1 1 0 01-.293.707l-6.414 6.414a1 1 0 00-.293.707V17l-4 4v-6.586a1 1 0 00-.293-.707L3.293 7.293A1 1 0 013 6.586V4z"></path>
-              </svg>
-              Apply
-            </span>
-          </button>
-          <a class="btn-secondary text-sm" href="{{ url_for('index') }}">
-            <span class="flex items-center gap-2">
-              <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M4 4v5h.582m15.356 2A8.001 8.001 0 004.582 9m0 0H9m11 11v-5h-.581m0 0a8.003 8.003 0 01-15.357-2m15.357 2H15"></path>
-              </svg>
-              Reset
-            </span>
-          </a>
-        </form>
-      </div>
-    </div>
-
-    <div class="grid grid-cols-1 lg:grid-cols-3 gap-6 mt-8">
-      <div class="modern-card p-6 animate-fade-in" style="animation-delay: 0.1s">
-        <div class="flex items-center gap-3 mb-4">
-          <div class="w-10 h-10 bg-gradient-to-br from-blue-500 to-blue-600 rounded-xl flex items-center justify-center">
-            <svg class="w-5 h-5 text-white" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-              <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M13 10V3L4 14h7v7l9-11h-7z"></path>
-            </svg>
-          </div>
-          <div>
-            <div class="text-lg font-semibold text-[var(--text-primary)]">Ingestion Status</div>
-            <div class="text-sm text-[var(--text-muted)]">Real-time feed health</div>
-          </div>
-        </div>
-        <div class="space-y-3">
-          <div class="flex justify-between items-center">
-            <span class="text-[var(--text-secondary)]">Last run (UTC):</span>
-            <span class="font-mono text-sm bg-[var(--bg-tertiary)] px-2 py-1 rounded-lg">{{ status.last_run_utc or "—" }}</span>
-          </div>
-          <div class="flex justify-between items-center">
-            <span class="text-[var(--text-secondary)]">Items added:</span>
-            <span class="font-semibold text-[var(--accent-green)]">{{ status.items_added }}</span>
-          </div>
-          <div class="flex justify-between items-center">
-            <span class="text-[var(--text-secondary)]">Last error:</span>
-            <span class="font-medium {% if status.last_error %}text-[var(--accent-red)]{% else %}text-[var(--text-muted)]{% endif %}">{{ status.last_error or "none" }}</span>
-          </div>
-        </div>
-      </div>
-
-      <div class="modern-card p-6 lg:col-span-2 animate-fade-in" style="animation-delay: 0.2s">
-        <div class="flex items-center justify-between mb-4">
-          <div class="flex items-center gap-3">
-            <div class="w-10 h-10 bg-gradient-to-br from-purple-500 to-purple-600 rounded-xl flex items-center justify-center">
-              <svg class="w-5 h-5 text-white" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M7 7h.01M7 3h5c.512 0 1.024.195 1.414.586l7 7a2 2 0 010 2.828l-7 7a.997.997 0 01-1.414 0l-7-7A1.994 1.994 0 013 12V7a4 4 0 014-4z"></path>
-              </svg>
-            </div>
-            <div>
-              <div class="text-lg font-semibold text-[var(--text-primary)]">Top Topics</div>
-              <div class="text-sm text-[var(--text-muted)]">Trending conversation drivers</div>
-            </div>
-          </div>
-          <div class="text-xs text-[var(--text-muted)] bg-[var(--bg-tertiary)] px-3 py-1 rounded-full">
-            Deterministic tags v0
-          </div>
-        </div>
-        <div class="mt-4">
-          <canvas id="topicsChart" height="120"></canvas>
-        </div>
-      </div>
-
-      <div class="modern-card p-6 lg:col-span-3 animate-fade-in" style="animation-delay: 0.3s">
-        <div class="flex items-center justify-between gap-4 flex-wrap mb-4">
-          <div class="flex items-center gap-3">
-            <div class="w-10 h-10 bg-gradient-to-br from-orange-500 to-orange-600 rounded-xl flex items-center justify-center">
-              <svg class="w-5 h-5 text-white" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M9 19v-6a2 2 0 00-2-2H5a2 2 0 00-2 2v6a2 2 0 002 2h2a2 2 0 002-2zm0 0V9a2 2 0 012-2h2a2 2 0 012 2v10m-6 0a2 2 0 002 2h2a2 2 0 002-2m0 0V5a2 2 0 012-2h2a2 2 0 012 2v14a2 2 0 01-2 2h-2a2 2 0 01-2-2z"></path>
-              </svg>
-            </div>
-            <div>
-              <div class="text-lg font-semibold text-[var(--text-primary)]">Framing Analysis</div>
-              <div class="text-sm text-[var(--text-muted)]">Sentiment distribution across headlines</div>
-            </div>
-          </div>
-          <div class="text-xs text-[var(--text-muted)] bg-[var(--bg-tertiary)] px-3 py-1 rounded-full">
-            Headline cues only
-          </div>
-        </div>
-        <div class="bg-[var(--bg-secondary)] rounded-lg p-4 mb-4">
-          <div class="text-xs text-[var(--text-secondary)]">
-            💡 Tip: Filter by a specific topic for cleaner sentiment analysis
-          </div>
-        </div>
-        <div class="mt-4">
-          <canvas id="skewChart" height="100"></canvas>
-        </div>
-      </div>
-
-      <div class="modern-card p-6 lg:col-span-3 animate-fade-in" style="animation-delay: 0.4s">
-        <div class="flex items-center justify-between gap-4 flex-wrap mb-4">
-          <div class="flex items-center gap-3">
-            <div class="w-10 h-10 bg-gradient-to-br from-emerald-500 to-emerald-600 rounded-xl flex items-center justify-center">
-              <svg class="w-5 h-5 text-white" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M13 7h8m0 0v8m0-8l-8 8-4-4-6 6"></path>
-              </svg>
-            </div>
-            <div>
-              <div class="text-lg font-semibold text-[var(--text-primary)]">Topic Acceleration</div>
-              <div class="text-sm text-[var(--text-muted)]">6h vs prior 6h momentum analysis</div>
-            </div>
-          </div>
-          {% if lookback_hours < 12 %}
-            <div class="text-xs text-[var(--accent-orange)] bg-orange-500/10 border border-orange-500/20 px-3 py-1 rounded-full">
-              Fixed 6h windows
-            </div>
-          {% endif %}
-        </div>
-        <div class="overflow-x-auto">
-          <table class="modern-table text-sm">
-            <thead>
-              <tr>
-                <th class="text-left">Topic</th>
-                <th class="text-right">Last 6h</th>
-                <th class="text-right">Prior 6h</th>
-                <th class="text-right">Delta</th>
-                <th class="text-right">Ratio</th>
-              </tr>
-            </thead>
-            <tbody>
-              {% if acceleration %}
-                {% for accel in acceleration %}
-                  <tr>
-                    <td class="font-semibold text-[var(--text-primary)]">{{ accel.topic }}</td>
-                    <td class="text-right text-[var(--text-secondary)]">{{ accel.count_a }}</td>
-                    <td class="text-right text-[var(--text-secondary)]">{{ accel.count_b }}</td>
-                    <td class="text-right">
-                      <span class="{% if accel.delta > 0 %}text-[var(--accent-green)] font-semibold{% elif accel.delta < 0 %}text-[var(--accent-red)]{% else %}text-[var(--text-muted)]{% endif %}">
-                        {% if accel.delta > 0 %}+{% endif %}{{ accel.delta }}
-                      </span>
-                    </td>
-                    <td class="text-right text-[var(--text-secondary)]">{{ "%.1f"|format(accel.ratio) }}</td>
-                  </tr>
-                {% endfor %}
-              {% else %}
-                <tr>
-                  <td colspan="5" class="py-8 text-center text-[var(--text-muted)]">
-                    <div class="flex flex-col items-center gap-2">
-                      <svg class="w-8 h-8 text-[var(--text-muted)]" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                        <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M9.663 17h4.673M12 3v1m6.364 1.636l-.707.707M21 12h-1M4 12H3m3.343-5.657l-.707-.707m2.828 9.9a5 5 0 117.072 0l-.548.547A3.374 3.374 0 0014 18.469V19a2 2 0 11-4 0v-.531c0-.895-.356-1.754-.988-2.386l-.548-.547z"></path>
-                      </svg>
-                      No acceleration data available
-                    </div>
-                  </td>
-                </tr>
-              {% endif %}
-            </tbody>
-          </table>
-        </div>
-      </div>
-
-      <div class="modern-card p-6 lg:col-span-3 animate-fade-in" style="animation-delay: 0.5s">
-        <div class="flex items-center gap-3 mb-4">
-          <div class="w-10 h-10 bg-gradient-to-br from-cyan-500 to-cyan-600 rounded-xl flex items-center justify-center">
-            <svg class="w-5 h-5 text-white" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-              <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M9 12l2 2 4-4m6 2a9 9 0 11-18 0 9 9 0 0118 0z"></path>
-            </svg>
-          </div>
-          <div>
-            <div class="text-lg font-semibold text-[var(--text-primary)]">Source Health Monitor</div>
-            <div class="text-sm text-[var(--text-muted)]">Feed reliability and error tracking</div>
-          </div>
-        </div>
-        <div class="overflow-x-auto">
-          <table class="modern-table text-sm">
-            <thead>
-              <tr>
-                <th class="text-left">Source</th>
-                <th class="text-left">Last Fetch</th>
-                <th class="text-left">Status</th>
-                <th class="text-right">Items Seen</th>
-                <th class="text-right">Items Added</th>
-              </tr>
-            </thead>
-            <tbody>
-              {% for sh in source_health %}
-                <tr>
-                  <td>
-                    <div class="font-semibold text-[var(--text-primary)]">{{ sh.publisher }}</div>
-                    <div class="text-[var(--text-muted)] text-xs">{{ sh.feed_name }} • Category {{ sh.category }}</div>
-                  </td>
-                  <td class="text-[var(--text-secondary)]">
-                    <span class="font-mono text-xs">{{ sh.last_fetch_utc or "—" }}</span>
-                  </td>
-                  <td>
-                    {% if sh.last_error %}
-                      <div class="flex items-center gap-2">
-                        <div class="w-2 h-2 bg-red-500 rounded-full"></div>
-                        <span class="text-[var(--accent-red)] font-medium">Error</span>
-                      </div>
-                      <div class="text-[var(--text-muted)] text-xs mt-1 max-w-xs truncate" title="{{ sh.last_error }}">{{ sh.last_error[:50] }}{% if sh.last_error|length > 50 %}...{% endif %}</div>
-                    {% elif sh.last_ok_utc %}
-                      <div class="flex items-center gap-2">
-                        <div class="w-2 h-2 bg-green-500 rounded-full"></div>
-                        <span class="text-[var(--accent-green)] font-medium">Healthy</span>
-                      </div>
-                      {% if sh.last_http_status %}
-                        <div class="text-[var(--text-muted)] text-xs mt-1">HTTP {{ sh.last_http_status }}</div>
-                      {% endif %}
-                    {% else %}
-                      <div class="flex items-center gap-2">
-                        <div class="w-2 h-2 bg-gray-500 rounded-full"></div>
-                        <span class="text-[var(--text-muted)]">Unknown</span>
-                      </div>
-                    {% endif %}
-                  </td>
-                  <td class="text-right text-[var(--text-secondary)]">{{ sh.items_seen_last_fetch }}</td>
-                  <td class="text-right">
-                    <span class="{% if sh.items_added_last_fetch > 0 %}text-[var(--accent-green)] font-semibold{% else %}text-[var(--text-secondary)]{% endif %}">
-                      {{ sh.items_added_last_fetch }}
-                    </span>
-                  </td>
-                </tr>
-              {% endfor %}
-            </tbody>
-          </table>
-        </div>
-      </div>
-
-      <div class="modern-card p-6 lg:col-span-3 animate-fade-in" style="animation-delay: 0.6s">
-        <div class="flex items-center gap-3 mb-4">
-          <div class="w-10 h-10 bg-gradient-to-br from-indigo-500 to-indigo-600 rounded-xl flex items-center justify-center">
-            <svg class="w-5 h-5 text-white" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-              <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M19 11H5m14 0a2 2 0 012 2v6a2 2 0 01-2 2H5a2 2 0 01-2-2v-6a2 2 0 012-2m14 0V9a2 2 0 00-2-2M5 11V9a2 2 0 012-2m0 0V5a2 2 0 012-2h6a2 2 0 012 2v2M7 7h10"></path>
-            </svg>
-          </div>
-          <div>
-            <div class="text-lg font-semibold text-[var(--text-primary)]">Latest News Feed</div>
-            <div class="text-sm text-[var(--text-muted)]">Real-time financial news aggregation</div>
-          </div>
-        </div>
-        <div class="space-y-4">
-          {% for it in items %}
-            <div class="border border-[var(--border-primary)] rounded-lg p-4 hover:border-[var(--border-secondary)] transition-colors">
-              <div class="flex flex-col md:flex-row md:items-start gap-3">
-                <div class="md:w-64 shrink-0">
-                  <div class="text-xs text-[var(--text-muted)] mb-1">
-                    {{ it.publisher }} • {{ it.feed_name }}
-                  </div>
-                  <div class="text-xs text-[var(--text-secondary)] font-mono">
-                    {{ it.published_at or it.fetched_at }}
-                  </div>
-                  <div class="mt-2">
-                    <span class="inline-flex items-center px-2 py-1 rounded-full text-xs font-medium bg-[var(--bg-tertiary)] text-[var(--text-secondary)]">
-                      {% if it.category == "A" %}📈 Market News
-                      {% elif it.category == "B" %}📰 Interpretive/Opinion
-                      {% elif it.category == "C" %}🏛️ Macro/Policy Anchors
-                      {% elif it.category == "D" %}💼 Practitioner Commentary
-                      {% else %}📊 Other{% endif %}
-                    </span>
-                  </div>
-                </div>
-                <div class="flex-1 min-w-0">
-                  <h3 class="font-semibold text-[var(--text-primary)] hover:text-[var(--accent-blue)] transition-colors mb-2">
-                    <a href="{{ it.url }}" target="_blank" rel="noreferrer" class="block">
-                      {{ it.title }}
-                    </a>
-                  </h3>
-                  <div class="flex flex-wrap gap-2 mb-3">
-                    <span class="badge badge-{{ it.direction|lower }}">{{ it.direction }}</span>
-                    <span class="badge badge-neutral">{{ it.urgency }}</span>
-                    <span class="badge badge-neutral">{{ it.mode }}</span>
-                    {% for tag in it.asset_classes %}
-                      <span class="badge badge-asset">{{ tag }}</span>
-                    {% endfor %}
-                    {% for tag in it.geo_tags %}
-                      <span class="badge badge-geo">{{ tag }}</span>
-                    {% endfor %}
-                  </div>
-                  {% if it.summary %}
-                    <p class="text-[var(--text-secondary)] text-sm line-clamp-2">{{ it.summary }}</p>
-                  {% endif %}
-                </div>
-              </div>
-            </div>
-          {% endfor %}
-        </div>
-        {% if not items %}
-          <div class="text-center py-12">
-            <svg class="w-16 h-16 text-[var(--text-muted)] mx-auto mb-4" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-              <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M19 11H5m14 0a2 2 0 012 2v6a2 2 0 01-2 2H5a2 2 0 01-2-2v-6a2 2 0 012-2m14 0V9a2 2 0 00-2-2M5 11V9a2 2 0 012-2m0 0V5a2 2 0 012-2h6a2 2 0 012 2v2M7 7h10"></path>
-            </svg>
-            <p class="text-[var(--text-muted)] text-lg">No news items found</p>
-            <p class="text-[var(--text-secondary)] text-sm mt-1">Try adjusting your filters or check back later</p>
-          </div>
-        {% endif %}
-      </div>
-    </div>
-  </div>
-
-<script>
-  // Modern Chart.js configuration
-  Chart.defaults.color = '#cbd5e1';
-  Chart.defaults.borderColor = 'rgba(148,163,184,0.12)';
-  Chart.defaults.font.family = 'ui-sans-serif, system-ui, -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif';
-  Chart.defaults.font.size = 12;
-
-  // Custom color palettes
-  const chartColors = {
-    primary: ['#3b82f6', '#10b981', '#f59e0b', '#ef4444', '#8b5cf6', '#06b6d4', '#84cc16', '#f97316'],
-    gradients: [
-      'linear-gradient(135deg, #3b82f6 0%, #1d4ed8 100%)',
-      'linear-gradient(135deg, #10b981 0%, #047857 100%)',
-      'linear-gradient(135deg, #f59e0b 0%, #d97706 100%)',
-      'linear-gradient(135deg, #ef4444 0%, #dc2626 100%)'
-    ]
-  };
-
-  // Topic counts chart
-  const topicLabels = {{ topic_labels | safe }};
-  const topicCounts = {{ topic_counts | safe }};
-
-  const topicsCtx = document.getElementById("topicsChart").getContext("2d");
-  const topicsGradient = topicsCtx.createLinearGradient(0, 0, 0, 400);
-  topicsGradient.addColorStop(0, 'rgba(59, 130, 246, 0.8)');
-  topicsGradient.addColorStop(1, 'rgba(59, 130, 246, 0.1)');
-
-  new Chart(topicsCtx, {
-    type: "bar",
-    data: {
-      labels: topicLabels,
-      datasets: [{
-        label: "Articles",
-        data: topicCounts,
-        backgroundColor: topicsGradient,
-        borderColor: '#3b82f6',
-        borderWidth: 1,
-        borderRadius: 4,
-        borderSkipped: false,
-      }]
-    },
-    options: {
-      responsive: true,
-      maintainAspectRatio: false,
-      animation: {
-        duration: 1000,
-        easing: 'easeOutQuart'
-      },
-      plugins: {
-        legend: { display: false },
-        tooltip: {
-          backgroundColor: 'rgba(15, 23, 42, 0.9)',
-          titleColor: '#f8fafc',
-          bodyColor: '#cbd5e1',
-          borderColor: '#334155',
-          borderWidth: 1,
-          cornerRadius: 8,
-          displayColors: false,
-          callbacks: {
-            title: function(context) {
-              return `Topic: ${context[0].label}`;
-            },
-            label: function(context) {
-              return `Articles: ${context.parsed.y}`;
-            }
-          }
-        }
-      },
-      scales: {
-        x: {
-          ticks: {
-            color: "#cbd5e1",
-            font: { size: 11 },
-            maxRotation: 45
-          },
-          grid: {
-            color: "rgba(148,163,184,0.08)",
-            borderColor: "rgba(148,163,184,0.2)"
-          }
-        },
-        y: {
-          beginAtZero: true,
-          ticks: {
-            color: "#cbd5e1",
-            font: { size: 11 },
-            precision: 0
-          },
-          grid: {
-            color: "rgba(148,163,184,0.08)",
-            borderColor: "rgba(148,163,184,0.2)"
-          }
-        }
-      },
-      onHover: (event, activeElements) => {
-        event.native.target.style.cursor = activeElements.length > 0 ? 'pointer' : 'default';
-      }
-    }
-  });
-
-  // Framing skew chart
-  const skew = {{ skew | safe }};
-  const skewCtx = document.getElementById("skewChart").getContext("2d");
-
-  // Create gradients for each bar
-  const createGradient = (ctx, color1, color2) => {
-    const gradient = ctx.createLinearGradient(0, 0, 0, 100);
-    gradient.addColorStop(0, color1);
-    gradient.addColorStop(1, color2);
-    return gradient;
-  };
-
-  const skewGradients = [
-    createGradient(skewCtx, 'rgba(16, 185, 129, 0.8)', 'rgba(16, 185, 129, 0.3)'), // positive
-    createGradient(skewCtx, 'rgba(239, 68, 68, 0.8)', 'rgba(239, 68, 68, 0.3)'),   // negative
-    createGradient(skewCtx, 'rgba(148, 163, 184, 0.8)', 'rgba(148, 163, 184, 0.3)'), // neutral
-    createGradient(skewCtx, 'rgba(245, 158, 11, 0.8)', 'rgba(245, 158, 11, 0.3)')    // mixed
-  ];
-
-  new Chart(skewCtx, {
-    type: "bar",
-    data: {
-      labels: ["Positive", "Negative", "Neutral", "Mixed"],
-      datasets: [{
-        label: "Articles",
-        data: [skew.pos, skew.neg, skew.neutral, skew.mixed],
-        backgroundColor: skewGradients,
-        borderColor: ['#10b981', '#ef4444', '#94a3b8', '#f59e0b'],
-        borderWidth: 1,
-        borderRadius: 6,
-        borderSkipped: false,
-        hoverBackgroundColor: ['#059669', '#dc2626', '#64748b', '#d97706']
-      }]
-    },
-    options: {
-      responsive: true,
-      maintainAspectRatio: false,
-      animation: {
-        duration: 1200,
-        easing: 'easeOutQuart',
-        delay: function(context) {
-          return context.dataIndex * 100;
-        }
-      },
-      plugins: {
-        legend: { display: false },
-        tooltip: {
-          backgroundColor: 'rgba(15, 23, 42, 0.9)',
-          titleColor: '#f8fafc',
-          bodyColor: '#cbd5e1',
-          borderColor: '#334155',
-          borderWidth: 1,
-          cornerRadius: 8,
-          displayColors: false,
-          callbacks: {
-            title: function(context) {
-              return `Sentiment: ${context[0].label}`;
-            },
-            label: function(context) {
-              const total = skew.pos + skew.neg + skew.neutral + skew.mixed;
-              const percentage = total > 0 ? ((context.parsed.y / total) * 100).toFixed(1) : 0;
-              return `Articles: ${context.parsed.y} (${percentage}%)`;
-            }
-          }
-        }
-      },
-      scales: {
-        x: {
-          ticks: {
-            color: "#cbd5e1",
-            font: { size: 11, weight: '500' }
-          },
-          grid: {
-            color: "rgba(148,163,184,0.08)",
-            borderColor: "rgba(148,163,184,0.2)"
-          }
-        },
-        y: {
-          beginAtZero: true,
-          ticks: {
-            color: "#cbd5e1",
-            font: { size: 11 },
-            precision: 0
-          },
-          grid: {
-            color: "rgba(148,163,184,0.08)",
-            borderColor: "rgba(148,163,184,0.2)"
-          }
-        }
-      },
-      onHover: (event, activeElements) => {
-        event.native.target.style.cursor = activeElements.length > 0 ? 'pointer' : 'default';
-      }
-    }
-  });
-
-  // Enhanced UX and Modern Web Features
-  document.addEventListener('DOMContentLoaded', function() {
-    // Performance: Intersection Observer for lazy loading animations
-    const observerOptions = {
-      threshold: 0.1,
-      rootMargin: '50px 0px'
-    };
-
-    const observer = new IntersectionObserver((entries) => {
-      entries.forEach((entry, index) => {
-        if (entry.isIntersecting) {
-          entry.target.style.animationDelay = `${index * 100}ms`;
-          entry.target.classList.add('animate-fade-in');
-          observer.unobserve(entry.target);
-        }
-      });
-    }, observerOptions);
-
-    // Observe cards for lazy animations
-    const cards = document.querySelectorAll('.modern-card');
-    cards.forEach(card => observer.observe(card));
-
-    // Enhanced form submission with loading states
-    const forms = document.querySelectorAll('form');
-    forms.forEach(form => {
-      form.addEventListener('submit', function(e) {
-        const button = form.querySelector('button[type="submit"]');
-        if (button) {
-          const originalHTML = button.innerHTML;
-          button.innerHTML = `
-            <span class="flex items-center gap-2">
-              <svg class="animate-spin w-4 h-4" fill="none" viewBox="0 0 24 24">
-                <circle class="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" stroke-width="4"></circle>
-                <path class="opacity-75" fill="currentColor" d="M4 12a8 8 0 018-8V0C5.373 0 0 5.373 0 12h4zm2 5.291A7.962 7.962 0 014 12H0c0 3.042 1.135 5.824 3 7.938l3-2.647z"></path>
-              </svg>
-              Applying filters...
-            </span>
-          `;
-          button.classList.add('btn-loading');
-          button.disabled = true;
-
-          // Auto-reset after 3 seconds (handles both success and error cases)
-          setTimeout(() => {
-            button.innerHTML = originalHTML;
-            button.classList.remove('btn-loading');
-            button.disabled = false;
-          }, 3000);
-        }
-      });
-    });
-
-    // Enhanced keyboard navigation and accessibility
-    document.addEventListener('keydown', function(e) {
-      // Enhanced form navigation
-      if (e.key === 'Enter' && e.target.matches('input, select')) {
-        e.preventDefault();
-        const form = e.target.closest('form');
-        if (form) {
-          const submitBtn = form.querySelector('button[type="submit"]');
-          if (submitBtn && !submitBtn.disabled) {
-            submitBtn.focus();
-            setTimeout(() => submitBtn.click(), 100);
-          }
-        }
-      }
-
-      // Skip to main content (accessibility)
-      if (e.key === '/' && !e.target.matches('input, select, textarea')) {
-        e.preventDefault();
-        const mainContent = document.querySelector('main') || document.querySelector('.grid');
-        if (mainContent) {
-          mainContent.focus();
-          mainContent.scrollIntoView({ behavior: 'smooth', block: 'start' });
-        }
-      }
-    });
-
-    // Add ARIA labels and roles for accessibility
-    const statusCards = document.querySelectorAll('.modern-card');
-    statusCards.forEach((card, index) => {
-      card.setAttribute('role', 'region');
-      card.setAttribute('aria-labelledby', `card-title-${index}`);
-      const title = card.querySelector('h2, .text-lg');
-      if (title) {
-        title.id = `card-title-${index}`;
-      }
-    });
-
-    // Enhanced responsive chart resizing with debouncing
-    let resizeTimeout;
-    window.addEventListener('resize', function() {
-      clearTimeout(resizeTimeout);
-      resizeTimeout = setTimeout(function() {
-        // Force chart resize for better responsiveness
-        const charts = document.querySelectorAll('canvas');
-        charts.forEach(canvas => {
-          const chart = Chart.getChart(canvas);
-          if (chart) {
-            chart.resize();
-          }
-        });
-      }, 250);
-    });
-
-    // Performance: Preload critical resources
-    const preloadLinks = [
-      'https://cdn.tailwindcss.com',
-      'https://cdn.jsdelivr.net/npm/chart.js@4.4.0'
-    ];
-
-    preloadLinks.forEach(url => {
-      const link = document.createElement('link');
-      link.rel = 'preload';
-      link.href = url;
-      link.as = 'script';
-      document.head.appendChild(link);
-    });
-
-    // Add service worker for caching (if supported)
-    if ('serviceWorker' in navigator) {
-      window.addEventListener('load', function() {
-        // Could register a service worker here for caching static assets
-        // navigator.serviceWorker.register('/sw.js');
-      });
-    }
-
-    // Enhanced error handling
-    window.addEventListener('error', function(e) {
-      console.error('JavaScript error:', e.error);
-      // Could send to error tracking service
-    });
-
-    window.addEventListener('unhandledrejection', function(e) {
-      console.error('Unhandled promise rejection:', e.reason);
-      // Could send to error tracking service
-    });
-
-    // Performance monitoring (basic)
-    const perfData = performance.getEntriesByType('navigation')[0];
-    if (perfData) {
-      console.log(`Page load time: ${perfData.loadEventEnd - perfData.fetchStart}ms`);
-    }
-
-    // Add touch gesture support for mobile
-    let touchStartY = 0;
-    let touchEndY = 0;
-
-    document.addEventListener('touchstart', function(e) {
-      touchStartY = e.changedTouches[0].screenY;
-    });
-
-    document.addEventListener('touchend', function(e) {
-      touchEndY = e.changedTouches[0].screenY;
-      const diff = touchStartY - touchEndY;
-
-      // Swipe up to scroll to top (on mobile)
-      if (diff > 100 && window.innerWidth < 768) {
-        window.scrollTo({ top: 0, behavior: 'smooth' });
-      }
-    });
-
-    // Enhanced tooltips for better UX
-    const tooltipElements = document.querySelectorAll('[title]');
-    tooltipElements.forEach(el => {
-      el.setAttribute('aria-label', el.getAttribute('title'));
-    });
-
-    // Auto-focus management
-    const focusableElements = 'button, [href], input, select, textarea, [tabindex]:not([tabindex="-1"])';
-    const firstFocusable = document.querySelector(focusableElements);
-
-    // Skip link for accessibility
-    const skipLink = document.createElement('a');
-    skipLink.href = '#main-content';
-    skipLink.textContent = 'Skip to main content';
-    skipLink.className = 'sr-only focus:not-sr-only focus:absolute focus:top-4 focus:left-4 bg-blue-600 text-white px-4 py-2 rounded-lg z-50';
-    skipLink.style.cssText = `
-      position: absolute;
-      top: -40px;
-      left: 6px;
-      background: #2563eb;
-      color: white;
-      padding: 8px 16px;
-      border-radius: 8px;
-      text-decoration: none;
-      z-index: 1000;
-      transition: top 0.2s;
-    `;
-    skipLink.addEventListener('focus', function() {
-      this.style.top = '6px';
-    });
-    skipLink.addEventListener('blur', function() {
-      this.style.top = '-40px';
-    });
-    document.body.insertBefore(skipLink, document.body.firstChild);
-
-    // Add main content landmark
-    const mainGrid = document.querySelector('.grid');
-    if (mainGrid) {
-      mainGrid.id = 'main-content';
-      mainGrid.setAttribute('role', 'main');
-    }
-
-    // Performance: Defer non-critical JavaScript
-    setTimeout(() => {
-      // Any non-critical enhancements can go here
-      console.log('Enhanced UX features loaded');
-    }, 100);
-  });
-
-  // Progressive enhancement: Check for modern features
-  if ('IntersectionObserver' in window) {
-    // Use modern intersection observer
-  } else {
-    // Fallback for older browsers
-    const cards = document.querySelectorAll('.modern-card');
-    cards.forEach(card => card.classList.add('animate-fade-in'));
-  }
-
-  // Feature detection and graceful degradation
-  const supportsCSSGrid = CSS.supports('display', 'grid');
-  const supportsCSSCustomProperties = CSS.supports('color', 'var(--test)');
-
-  if (!supportsCSSGrid) {
-    console.warn('CSS Grid not supported, falling back to flexbox');
-    // Could add fallback styles here
-  }
-
-  if (!supportsCSSCustomProperties) {
-    console.warn('CSS Custom Properties not supported, using fallback styles');
-    // Could add fallback styles here
-  }
-</script>
-</body>
-</html>
-"""
+# Aggregate dashboard queries are cached until the next fetch, but never for
+# longer than this so the lookback window keeps sliding (seconds)
+QUERY_CACHE_TTL = 60
+
+# Streamed pages are sent in pieces of about this many characters; Jinja yields
+# every template fragment separately, far too small to write one at a time
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# zlib level for gzipping the dashboard on the fly; level 1 already shrinks its
+# repetitive markup ~17x at a third of the CPU time of the default level
+GZIP_LEVEL = 1
+
+# Rendered dashboard bodies kept per ETag; up to ~1 MB each uncompressed
+PAGE_CACHE_SIZE = 8
+
+# Browsers may keep versioned static assets (?v=<content hash>) this long (seconds)
+STATIC_MAX_AGE = 365 * 24 * 3600
+
+# Item summaries are clamped to two lines on the page; cut them near this many
+# characters (at a word boundary) before sending
+SUMMARY_PREVIEW_CHARS = 300
+
+# Display name of each source category; anything else is shown as "E"
+CATEGORY_LABELS = {
+    "A": "📈 Market News",
+    "B": "📰 Interpretive/Opinion",
+    "C": "🏛️ Macro/Policy Anchors",
+    "D": "💼 Practitioner Commentary",
+    "E": "📊 Other",
+}
+
+
+def _close(chunks: Iterator[Any]) -> None:
+    """Close a stream's source if it can be closed (generators, stream_template)."""
+    close = getattr(chunks, "close", None)
+    if close is not None:
+        close()
+
+
+def _buffered(chunks: Iterator[str], size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """Join small chunks into pieces of at least ``size`` characters (the last may be shorter)."""
+    buf: List[str] = []
+    buffered = 0
+    try:
+        for chunk in chunks:
+            buf.append(chunk)
+            buffered += len(chunk)
+            if buffered >= size:
+                yield "".join(buf)
+                buf = []
+                buffered = 0
+        if buf:
+            yield "".join(buf)
+    finally:
+        # Close the source now if the client goes away mid-stream, so
+        # stream_with_context pops its request context in this thread
+        _close(chunks)
+
+
+def _gzipped(pieces: Iterator[str]) -> Iterator[bytes]:
+    """Gzip a stream of text pieces, flushing after each so the client can start on it."""
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    try:
+        for piece in pieces:
+            yield compressor.compress(piece.encode()) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
+    finally:
+        _close(pieces)
+
+
+def _encoded(pieces: Iterator[str]) -> Iterator[bytes]:
+    """UTF-8 encode a stream of text pieces, closing the source like _gzipped does."""
+    try:
+        for piece in pieces:
+            yield piece.encode()
+    finally:
+        _close(pieces)
+
+
+def _tags_json_sql(tag_type: str) -> str:
+    """Correlated subquery yielding an item's tags of one type as a JSON array, in tag order."""
+    return f"""(
+               SELECT json_group_array(tag) FROM (
+                   SELECT it.tag FROM item_tags it JOIN tags t ON t.tag = it.tag
+                   WHERE it.item_id = i.item_id AND t.tag_type = '{tag_type}'
+                   ORDER BY it.tag
+               ))"""
+
+
+class DashboardItem(NamedTuple):
+    """
+    One entry of the dashboard's item list. The template reads a dozen fields
+    per item; attribute access on a tuple beats Jinja's failed getattr and
+    fallback subscript on a dict.
+    """
+
+    item_id: str
+    publisher: str
+    feed_name: str
+    category: str
+    published_at: Optional[str]
+    fetched_at: str
+    title: str
+    url: str
+    summary: Optional[str]
+    direction: Optional[str]
+    urgency: Optional[str]
+    mode: Optional[str]
+    asset_classes: List[str]
+    geo_tags: List[str]
+
+
+class PageCache:
+    """
+    Small thread-safe LRU of response bodies by ETag.
+
+    The ETag changes whenever the page content may change, so entries never
+    go stale and only need evicting.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._bodies: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, etag: str) -> Optional[bytes]:
+        with self._lock:
+            body = self._bodies.get(etag)
+            if body is not None:
+                self._bodies.move_to_end(etag)
+            return body
+
+    def tee(self, etag: str, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        """Pass ``chunks`` through, caching the body once it has been sent in full."""
+        sent: List[bytes] = []
+        try:
+            for chunk in chunks:
+                sent.append(chunk)
+                yield chunk
+        finally:
+            # A client that disconnects mid-page closes us; pass that on
+            _close(chunks)
+        # Only reached when the whole body went out
+        with self._lock:
+            self._bodies[etag] = b"".join(sent)
+            while len(self._bodies) > self._size:
+                self._bodies.popitem(last=False)
+
+
+def _asset_version(path: str) -> str:
+    """Short content hash of a static file, used to bust browser caches when it changes."""
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=8).hexdigest()
 
 
 def create_app(app_title: str, default_lookback_hours: int, fetch_interval_seconds: int) -> Flask:
     """Create and configure the Flask application."""
     app = Flask(__name__)
+    # Templates live in src/templates; Jinja keeps them compiled after the
+    # first load, so compile the dashboard now rather than on the first visit
+    app.jinja_env.get_template("dashboard.html")
+    app.jinja_env.globals["asset_version"] = _asset_version(os.path.join(app.static_folder, "dashboard.css"))
+    app.jinja_env.globals.update(
+        category_labels=CATEGORY_LABELS,
+        other_category_label=CATEGORY_LABELS["E"],
+        summary_preview_chars=SUMMARY_PREVIEW_CHARS,
+    )
     _stop_event = threading.Event()
+    _wake_event = threading.Event()
     _worker_thread: Optional[threading.Thread] = None
+    _page_cache = PageCache(PAGE_CACHE_SIZE)
+    # Fetch epochs restart at 0 with the process; keep ETags from a previous run from matching
+    _etag_salt = str(time.time_ns())
 
     @app.before_request
     def _before_request() -> None:
         _ = db.get_db()
 
-    @app.teardown_appcontext
-    def _teardown(exc: Optional[BaseException]) -> None:
-        db_conn = g.pop("db", None)
-        if db_conn is not None:
-            db_conn.close()
+    app.teardown_appcontext(db.close_db)
 
-    def query_items(lookback_hours: int, category: Optional[str], topic: Optional[str]) -> List[Dict[str, Any]]:
+    @app.after_request
+    def _cache_versioned_assets(response: Response) -> Response:
+        # The version in the URL changes with the file, so the URL's content never does
+        if request.endpoint == "static" and "v" in request.args:
+            response.cache_control.public = True
+            response.cache_control.max_age = STATIC_MAX_AGE
+            response.cache_control.immutable = True
+        return response
+
+    def query_items(lookback_hours: int, category: Optional[str], topic: Optional[str]) -> List[DashboardItem]:
         db_conn = db.get_db()
         since = utils.utcnow() - timedelta(hours=lookback_hours)
-        where = ["(published_at IS NULL AND fetched_at >= ?) OR (published_at >= ?)"]
-        params: List[Any] = [since.isoformat(), since.isoformat()]
+        # effective_time is COALESCE(published_at, fetched_at), indexed
+        where = ["i.effective_time >= ?"]
+        params: List[Any] = [since.isoformat()]
 
         if category:
             where.append("s.category = ?")
             params.append(category)
         if topic:
-            where.append("it.tag = ?")
+            # Semi-join on the item_tags primary key; joining would fan out
+            # one row per tag and need a GROUP BY to collapse them again
+            where.append("EXISTS (SELECT 1 FROM item_tags it WHERE it.item_id = i.item_id AND it.tag = ?)")
             params.append(topic)
 
-        # Get items with their tags
+        # Get items with their tag lists (sources and signals are 1:1, so no de-duplication
+        # needed); the correlated subqueries only run for the rows that survive the LIMIT
         sql_items = f"""
-        SELECT i.*, s.publisher, s.feed_name, s.category,
-               sig.direction, sig.urgency, sig.mode
+        SELECT i.item_id, s.publisher, s.feed_name, s.category, i.published_at, i.fetched_at,
+               i.title, i.url, i.summary, sig.direction, sig.urgency, sig.mode,
+               {_tags_json_sql("asset_class")} as asset_classes,
+               {_tags_json_sql("geo")} as geo_tags
         FROM items i
         JOIN sources s ON s.source_id = i.source_id
         LEFT JOIN signals sig ON sig.item_id = i.item_id
-        LEFT JOIN item_tags it ON it.item_id = i.item_id
         WHERE {" AND ".join(where)}
-        GROUP BY i.item_id
-        ORDER BY COALESCE(i.published_at, i.fetched_at) DESC
+        ORDER BY i.effective_time DESC
         LIMIT 500
         """
-        items = db_conn.execute(sql_items, params).fetchall()
-
-        # Get tags for each item
-        item_ids = [item["item_id"] for item in items]
-        if item_ids:
-            placeholders = ",".join("?" * len(item_ids))
-            sql_tags = f"""
-            SELECT it.item_id, it.tag, t.tag_type
-            FROM item_tags it
-            JOIN tags t ON t.tag = it.tag
-            WHERE it.item_id IN ({placeholders})
-            ORDER BY it.item_id, t.tag_type, it.tag
-            """
-            tags_rows = db_conn.execute(sql_tags, item_ids).fetchall()
-
-            # Group tags by item_id and tag_type
-            tags_by_item = {}
-            for row in tags_rows:
-                item_id = row["item_id"]
-                if item_id not in tags_by_item:
-                    tags_by_item[item_id] = {"topics": [], "asset_classes": [], "geo_tags": []}
-                tag_type = row["tag_type"]
-                if tag_type == "topic":
-                    tags_by_item[item_id]["topics"].append(row["tag"])
-                elif tag_type == "asset_class":
-                    tags_by_item[item_id]["asset_classes"].append(row["tag"])
-                elif tag_type == "geo":
-                    tags_by_item[item_id]["geo_tags"].append(row["tag"])
-
-            # Add tags to items (convert Row objects to dicts for mutability)
-            items_with_tags = []
-            for item in items:
-                item_dict = dict(item)  # Convert Row to dict
-                item_id = item_dict["item_id"]
-                if item_id in tags_by_item:
-                    item_tags = tags_by_item[item_id]
-                    item_dict["asset_classes"] = item_tags["asset_classes"]
-                    item_dict["geo_tags"] = item_tags["geo_tags"]
-                else:
-                    item_dict["asset_classes"] = []
-                    item_dict["geo_tags"] = []
-                items_with_tags.append(item_dict)
-
-            items = items_with_tags
-
-        return items
+        return [
+            DashboardItem(*row[:-2], asset_classes=json.loads(row[-2]), geo_tags=json.loads(row[-1]))
+            for row in db_conn.execute(sql_items, params)
+        ]
 
     def query_topic_counts(lookback_hours: int, category: Optional[str]) -> List[Tuple[str, int]]:
         db_conn = db.get_db()
         since = utils.utcnow() - timedelta(hours=lookback_hours)
-        params: List[Any] = [since.isoformat(), since.isoformat()]
-        where = ["(i.published_at IS NULL AND i.fetched_at >= ?) OR (i.published_at >= ?)"]
+        params: List[Any] = [since.isoformat()]
+        # Drive the join from the effective_time index so the work is
+        # proportional to items in the window, not to all of item_tags
+        where = ["i.effective_time >= ?"]
+        category_join = ""
         if category:
+            category_join = "JOIN sources s ON s.source_id = i.source_id"
             where.append("s.category = ?")
             params.append(category)
 
+        # (item_id, tag) is the item_tags primary key, so COUNT(*) counts distinct items
         sql = f"""
-        SELECT it.tag as tag, COUNT(DISTINCT i.item_id) as n
+        SELECT it.tag as tag, COUNT(*) as n
         FROM items i
-        JOIN sources s ON s.source_id = i.source_id
+        {category_join}
         JOIN item_tags it ON it.item_id = i.item_id
         WHERE {" AND ".join(where)}
         GROUP BY it.tag
@@ -1246,17 +272,19 @@ def create_app(app_title: str, default_lookback_hours: int, fetch_interval_secon
     def query_framing_skew(lookback_hours: int, topic: Optional[str]) -> Dict[str, int]:
         db_conn = db.get_db()
         since = utils.utcnow() - timedelta(hours=lookback_hours)
-        params: List[Any] = [since.isoformat(), since.isoformat()]
-        where = ["(i.published_at IS NULL AND i.fetched_at >= ?) OR (i.published_at >= ?)"]
+        params: List[Any] = [since.isoformat()]
+        where = ["i.effective_time >= ?"]
         if topic:
-            where.append("it.tag = ?")
+            # Semi-join rather than joining item_tags, which fans out one row
+            # per tag and needs COUNT(DISTINCT) to undo it
+            where.append("EXISTS (SELECT 1 FROM item_tags it WHERE it.item_id = i.item_id AND it.tag = ?)")
             params.append(topic)
 
+        # signals is 1:1 with items, so COUNT(*) counts distinct items
         sql = f"""
-        SELECT sig.direction as direction, COUNT(DISTINCT i.item_id) as n
+        SELECT sig.direction as direction, COUNT(*) as n
         FROM items i
         LEFT JOIN signals sig ON sig.item_id = i.item_id
-        LEFT JOIN item_tags it ON it.item_id = i.item_id
         WHERE {" AND ".join(where)}
         GROUP BY sig.direction
         """
@@ -1269,6 +297,24 @@ def create_app(app_title: str, default_lookback_hours: int, fetch_interval_secon
             out[k] = int(r["n"])
         return out
 
+    @functools.lru_cache(maxsize=128)
+    def _cached_topic_counts(lookback_hours: int, category: Optional[str],
+                             epoch: int, ttl_bucket: int) -> List[Tuple[str, int]]:
+        return query_topic_counts(lookback_hours, category)
+
+    @functools.lru_cache(maxsize=128)
+    def _cached_framing_skew(lookback_hours: int, topic: Optional[str],
+                             epoch: int, ttl_bucket: int) -> Dict[str, int]:
+        return query_framing_skew(lookback_hours, topic)
+
+    @functools.lru_cache(maxsize=32)
+    def _cached_acceleration(category: Optional[str], epoch: int, ttl_bucket: int) -> List[Dict[str, Any]]:
+        return query_acceleration(category)
+
+    def _cache_key() -> Tuple[int, int]:
+        """Return (fetch epoch, TTL bucket) so entries expire on new data or after QUERY_CACHE_TTL."""
+        return ingest.get_fetch_epoch(), int(time.monotonic() // QUERY_CACHE_TTL)
+
     def query_acceleration(category: Optional[str]) -> List[Dict[str, Any]]:
         """
         Compute topic acceleration: last 6h vs prior 6h (6-12h ago).
@@ -1278,74 +324,36 @@ def create_app(app_title: str, default_lookback_hours: int, fetch_interval_secon
         now = utils.utcnow()
         window_a_start = (now - timedelta(hours=6)).isoformat()
         window_b_start = (now - timedelta(hours=12)).isoformat()
-        window_b_end = window_a_start
-        
-        # Build params for window A (last 6h)
-        params_a: List[Any] = [window_a_start, window_a_start]
-        where_a = ["(i.published_at IS NULL AND i.fetched_at >= ?) OR (i.published_at >= ?)"]
-        category_join_a = ""
-        if category:
-            category_join_a = "JOIN sources s ON s.source_id = i.source_id"
-            where_a.append("s.category = ?")
-            params_a.append(category)
-        
-        # Build params for window B (6-12h ago)
-        params_b: List[Any] = [window_b_start, window_b_start, window_b_end, window_b_end]
-        where_b = ["(i.published_at IS NULL AND i.fetched_at >= ? AND i.fetched_at < ?) OR (i.published_at >= ? AND i.published_at < ?)"]
-        category_join_b = ""
+
+        # One pass over the last 12h counts both windows per tag; rows before
+        # window A's start fall in window B
+        params: List[Any] = [window_a_start, window_a_start, window_b_start]
+        where = ["i.effective_time >= ?"]
+        category_join = ""
         if category:
-            category_join_b = "JOIN sources s ON s.source_id = i.source_id"
-            where_b.append("s.category = ?")
-            params_b.append(category)
-        
-        # Count items in window A (last 6h) per topic
-        sql_a = f"""
-        SELECT it.tag as topic, COUNT(DISTINCT i.item_id) as count_a
-        FROM items i
-        {category_join_a}
-        JOIN item_tags it ON it.item_id = i.item_id
-        WHERE {" AND ".join(where_a)}
-        GROUP BY it.tag
-        """
-        
-        # Count items in window B (6-12h ago) per topic
-        sql_b = f"""
-        SELECT it.tag as topic, COUNT(DISTINCT i.item_id) as count_b
-        FROM items i
-        {category_join_b}
-        JOIN item_tags it ON it.item_id = i.item_id
-        WHERE {" AND ".join(where_b)}
-        GROUP BY it.tag
+            category_join = "JOIN sources s ON s.source_id = i.source_id"
+            where.append("s.category = ?")
+            params.append(category)
+
+        # (item_id, tag) is the item_tags primary key, so rows count distinct items.
+        # Ratio is count_a / count_b, or count_a when window B is empty
+        sql = f"""
+        SELECT topic, count_a, count_b, count_a - count_b as delta,
+               CAST(count_a AS REAL) / (CASE WHEN count_b > 0 THEN count_b ELSE 1 END) as ratio
+        FROM (
+            SELECT it.tag as topic,
+                   SUM(i.effective_time >= ?) as count_a,
+                   COUNT(*) - SUM(i.effective_time >= ?) as count_b
+            FROM items i
+            {category_join}
+            JOIN item_tags it ON it.item_id = i.item_id
+            WHERE {" AND ".join(where)}
+            GROUP BY it.tag
+        )
+        ORDER BY delta DESC, ratio DESC, topic
+        LIMIT 15
         """
-        
-        # Get counts for both windows
-        rows_a = db_conn.execute(sql_a, params_a).fetchall()
-        rows_b = db_conn.execute(sql_b, params_b).fetchall()
-        
-        # Build dicts
-        counts_a = {r["topic"]: int(r["count_a"]) for r in rows_a}
-        counts_b = {r["topic"]: int(r["count_b"]) for r in rows_b}
-        
-        # Combine and compute delta/ratio
-        all_topics = set(counts_a.keys()) | set(counts_b.keys())
-        results = []
-        for topic in all_topics:
-            count_a = counts_a.get(topic, 0)
-            count_b = counts_b.get(topic, 0)
-            delta = count_a - count_b
-            # Ratio: count_a / count_b if count_b > 0, else count_a
-            ratio = count_a / count_b if count_b > 0 else float(count_a) if count_a > 0 else 0.0
-            results.append({
-                "topic": topic,
-                "count_a": count_a,
-                "count_b": count_b,
-                "delta": delta,
-                "ratio": ratio,
-            })
-        
-        # Sort by delta DESC, then ratio DESC
-        results.sort(key=lambda x: (x["delta"], x["ratio"]), reverse=True)
-        return results[:15]  # Limit 15 rows
+        return [dict(r) for r in db_conn.execute(sql, params)]
 
     def query_source_health() -> List[sqlite3.Row]:
         """Get top 10 sources by recent errors or status."""
@@ -1362,24 +370,22 @@ def create_app(app_title: str, default_lookback_hours: int, fetch_interval_secon
         """
         return db_conn.execute(sql).fetchall()
 
-    @app.route("/")
-    def index() -> Response:
-        lookback = int(request.args.get("lookback", default_lookback_hours))
-        category = request.args.get("category") or None
-        topic = (request.args.get("topic") or "").strip() or None
-
+    def render_dashboard(lookback: int, category: Optional[str], topic: Optional[str]) -> Iterator[str]:
+        """Run the dashboard queries and return the page as a stream of text pieces."""
         items = query_items(lookback, category, topic)
-        topic_counts = query_topic_counts(lookback, category)
-        skew = query_framing_skew(lookback, topic)
+        topic_counts = _cached_topic_counts(lookback, category, *_cache_key())
+        skew = dict(_cached_framing_skew(lookback, topic, *_cache_key()))
         source_health = query_source_health()
-        acceleration = query_acceleration(category)
+        acceleration = _cached_acceleration(category, *_cache_key())
 
         labels = [t for (t, n) in topic_counts]
         counts = [n for (t, n) in topic_counts]
 
         status = ingest.get_fetch_status()
-        return render_template_string(
-            TEMPLATE,
+        # Stream the page so the head and filters go out while the item list
+        # is still rendering, instead of building the whole HTML string first
+        return _buffered(stream_template(
+            "dashboard.html",
             title=app_title,
             lookback_hours=lookback,
             category=category,
@@ -1388,14 +394,50 @@ def create_app(app_title: str, default_lookback_hours: int, fetch_interval_secon
             topic_labels=labels,
             topic_counts=counts,
             skew=skew,
-            status=type("S", (), status),
+            status=status,  # Jinja resolves status.key on dicts
             source_health=source_health,
             acceleration=acceleration,
-        )
+        ))
+
+    @app.route("/")
+    def index() -> Response:
+        lookback = int(request.args.get("lookback", default_lookback_hours))
+        category = request.args.get("category") or None
+        topic = (request.args.get("topic") or "").strip() or None
+
+        # The page only changes with a fetch or as the lookback window slides,
+        # which is what the query cache key tracks; skip the queries and the
+        # render entirely when the browser already has this version
+        gzip = request.accept_encodings["gzip"] > 0
+        etag = hashlib.blake2b(
+            repr((_etag_salt, _cache_key(), request.full_path, gzip)).encode(), digest_size=16
+        ).hexdigest()
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+            response.vary.add("Accept-Encoding")
+            response.set_etag(etag)
+            return response
+
+        # Another client or tab may have rendered this exact version already
+        body = _page_cache.get(etag)
+        if body is None:
+            page = render_dashboard(lookback, category, topic)
+            body = _page_cache.tee(etag, _gzipped(page) if gzip else _encoded(page))
+        response = Response(body)
+        if gzip:
+            response.content_encoding = "gzip"
+        response.vary.add("Accept-Encoding")
+        response.set_etag(etag)
+        # Revalidate on every visit (a 304 is cheap) so "Fetch now" results show up at once
+        response.headers["Cache-Control"] = "private, no-cache"
+        return response
 
     @app.route("/fetch-now")
     def fetch_now() -> Response:
-        ingest.fetch_once()
+        # A fetch takes as long as the slowest feed, so leave it to the worker
+        # thread and its writer connection; clicks during a fetch add nothing
+        start_worker_if_needed()
+        ingest.request_fetch(_wake_event)
         return redirect(url_for("index"))
 
     @app.route("/healthz")
@@ -1470,105 +512,13 @@ def create_app(app_title: str, default_lookback_hours: int, fetch_interval_secon
 
         success_msg = request.args.get("success")
 
-        # Use Jinja2 templating like the main dashboard
-        template = f"""
-<!doctype html>
-<html lang="en">
-<head>
-  <meta charset="utf-8" />
-  <meta name="viewport" content="width=device-width,initial-scale=1" />
-  <title>Database Maintenance — RSS Dashboard</title>
-  <script src="https://cdn.tailwindcss.com"></script>
-</head>
-<body class="bg-slate-950 text-slate-100">
-  <div class="max-w-4xl mx-auto p-4 md:p-8">
-    <div class="mb-6">
-      <a href="{url_for('index')}" class="text-indigo-300 hover:text-indigo-200">&larr; Back to Dashboard</a>
-    </div>
-
-    <h1 class="text-2xl md:text-3xl font-semibold mb-6">Database Maintenance</h1>
-
-    {{% if success_msg %}}
-      <div class="bg-green-900 border border-green-700 rounded-xl p-4 mb-6">
-        <div class="text-green-200">{{{{ success_msg }}}}</div>
-      </div>
-    {{% endif %}}
-
-    <div class="grid grid-cols-1 md:grid-cols-3 gap-6">
-      <div class="bg-slate-900 border border-slate-800 rounded-2xl p-6">
-        <h2 class="text-lg font-medium mb-4">Database Status</h2>
-        <div class="space-y-3">
-          <div class="flex justify-between">
-            <span class="text-slate-300">File size:</span>
-            <span class="font-medium">{size_str}</span>
-          </div>
-          <div class="flex justify-between">
-            <span class="text-slate-300">Retention period:</span>
-            <span class="font-medium">{retention_days} days</span>
-          </div>
-          <div class="flex justify-between">
-            <span class="text-slate-300">Last cleanup:</span>
-            <span class="font-medium">{last_cleanup or "Never"}</span>
-          </div>
-        </div>
-      </div>
-
-      <div class="bg-slate-900 border border-slate-800 rounded-2xl p-6">
-        <h2 class="text-lg font-medium mb-4">Cleanup & Maintenance</h2>
-        <div class="space-y-4">
-          <form method="post" class="inline">
-            <input type="hidden" name="action" value="cleanup" />
-            <button type="submit" class="px-4 py-2 bg-indigo-600 hover:bg-indigo-500 rounded-xl font-medium">
-              Run Cleanup Now
-            </button>
-          </form>
-          <div class="text-sm text-slate-400">
-            Deletes items older than {retention_days} days based on published date.
-          </div>
-
-          <hr class="border-slate-700" />
-
-          <form method="post" class="inline">
-            <input type="hidden" name="action" value="vacuum" />
-            <button type="submit" class="px-4 py-2 bg-orange-600 hover:bg-orange-500 rounded-xl font-medium">
-              Run VACUUM
-            </button>
-          </form>
-          <div class="text-sm text-slate-400">
-            Reclaims disk space. May take time on large databases.
-          </div>
-        </div>
-      </div>
-
-      <div class="bg-slate-900 border border-slate-800 rounded-2xl p-6">
-        <h2 class="text-lg font-medium mb-4">Archiving</h2>
-        <div class="space-y-4">
-          <form method="post" class="space-y-3">
-            <input type="hidden" name="action" value="archive" />
-            <div>
-              <label class="block text-sm text-slate-300 mb-1">Archive items older than:</label>
-              <select name="archive_days" class="bg-slate-800 border border-slate-600 rounded-lg px-3 py-2 text-sm w-full">
-                <option value="365">1 year (365 days)</option>
-                <option value="180">6 months (180 days)</option>
-                <option value="90">3 months (90 days)</option>
-                <option value="30">1 month (30 days)</option>
-              </select>
-            </div>
-            <button type="submit" class="px-4 py-2 bg-green-600 hover:bg-green-500 rounded-xl font-medium w-full">
-              Create Archive
-            </button>
-          </form>
-          <div class="text-sm text-slate-400">
-            Exports old data to compressed JSON file before deletion. Useful for historical analysis.
-          </div>
-        </div>
-      </div>
-    </div>
-  </div>
-</body>
-</html>
-"""
-        return render_template_string(template, success_msg=success_msg)
+        return render_template(
+            "maintenance.html",
+            success_msg=success_msg,
+            size_str=size_str,
+            retention_days=retention_days,
+            last_cleanup=last_cleanup,
+        )
 
     @app.route("/debug/rules")
     def debug_rules() -> Response:
@@ -1583,10 +533,9 @@ def create_app(app_title: str, default_lookback_hours: int, fetch_interval_secon
         sql_items = """
         SELECT i.item_id, i.title
         FROM items i
-        WHERE (i.published_at IS NOT NULL AND i.published_at >= ?) OR
-              (i.published_at IS NULL AND i.fetched_at >= ?)
+        WHERE i.effective_time >= ?
         """
-        items = db_conn.execute(sql_items, (since.isoformat(), since.isoformat())).fetchall()
+        items = db_conn.execute(sql_items, (since.isoformat(),)).fetchall()
 
         # Count rule hits
         rule_counts = {
@@ -1626,7 +575,7 @@ def create_app(app_title: str, default_lookback_hours: int, fetch_interval_secon
             return
         _worker_thread = threading.Thread(
             target=ingest.fetch_loop,
-            args=(_stop_event, fetch_interval_seconds),
+            args=(_stop_event, fetch_interval_seconds, _wake_event),
             daemon=True,
         )
         _worker_thread.start()
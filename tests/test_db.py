@@ -115,6 +115,7 @@ class TestDatabase(unittest.TestCase):
             }
 
             db.upsert_item_and_annotations(conn, test_item)
+            conn.commit()
 
             # Verify item exists
             cursor = conn.execute("SELECT COUNT(*) FROM items WHERE item_id = ?", ("test_cleanup_item",))
@@ -129,6 +130,13 @@ class TestDatabase(unittest.TestCase):
             # Verify item is gone
             cursor = conn.execute("SELECT COUNT(*) FROM items WHERE item_id = ?", ("test_cleanup_item",))
             self.assertEqual(cursor.fetchone()[0], 0)
+
+            # The deletes are committed, not left pending on this connection
+            other = db.connect()
+            try:
+                self.assertEqual(other.execute("SELECT COUNT(*) FROM items").fetchone()[0], 0)
+            finally:
+                other.close()
         finally:
             conn.close()
 
@@ -146,6 +154,45 @@ class TestDatabase(unittest.TestCase):
 
             self.assertIn("No items found older than 365 days", str(cm.exception))
 
+    def test_archive_old_items_writes_jsonl(self):
+        """Test that archived items are streamed as gzipped JSON Lines."""
+        import gzip
+        import json
+        import os
+
+        conn = db.connect()
+        try:
+            db.upsert_item_and_annotations(conn, {
+                "item_id": "archive_item",
+                "source_id": "test_source",
+                "published_at": "2020-01-01T00:00:00+00:00",
+                "fetched_at": "2020-01-01T00:00:00+00:00",
+                "title": "Archived Headline",
+                "url": "https://example.com/archived",
+                "topics": ["fed"],
+                "asset_classes": [],
+                "geo_tags": ["US"],
+                "direction": "neutral",
+                "urgency": "low",
+                "mode": "unknown",
+            })
+            archive_path = db.archive_old_items(conn, 365)
+        finally:
+            conn.close()
+
+        try:
+            self.assertTrue(archive_path.endswith(".jsonl.gz"))
+            with gzip.open(archive_path, "rt", encoding="utf-8") as f:
+                lines = [json.loads(line) for line in f]
+        finally:
+            os.unlink(archive_path)
+
+        self.assertEqual(lines[0]["total_items"], 1)
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(lines[1]["title"], "Archived Headline")
+        self.assertEqual(lines[1]["topics"], ["fed"])
+        self.assertEqual(lines[1]["geo_tags"], ["US"])
+
     def test_upsert_item_and_annotations(self):
         """Test inserting and updating items with annotations."""
         conn = sqlite3.connect(db.DB_PATH, check_same_thread=False, timeout=30.0)
@@ -172,7 +219,7 @@ class TestDatabase(unittest.TestCase):
             }
 
             # Insert item
-            db.upsert_item_and_annotations(conn, test_item)
+            self.assertTrue(db.upsert_item_and_annotations(conn, test_item))
 
             # Verify item exists
             cursor = conn.execute("SELECT * FROM items WHERE item_id = ?", ("test_upsert_item",))
@@ -204,7 +251,7 @@ class TestDatabase(unittest.TestCase):
 
             # Update item (should not create duplicates)
             test_item["title"] = "Updated Test Item"
-            db.upsert_item_and_annotations(conn, test_item)
+            self.assertFalse(db.upsert_item_and_annotations(conn, test_item))
 
             # Verify still only one item
             cursor = conn.execute("SELECT COUNT(*) FROM items WHERE item_id = ?", ("test_upsert_item",))
@@ -213,6 +260,120 @@ class TestDatabase(unittest.TestCase):
             # Verify title was updated
             cursor = conn.execute("SELECT title FROM items WHERE item_id = ?", ("test_upsert_item",))
             self.assertEqual(cursor.fetchone()[0], "Updated Test Item")
+
+            # Seeing the same entry again on a later fetch writes nothing
+            before = conn.total_changes
+            db.upsert_item_and_annotations(conn, dict(test_item, fetched_at="2026-01-21T12:00:00.000000+00:00"))
+            self.assertEqual(conn.total_changes, before)
+            cursor = conn.execute("SELECT fetched_at FROM items WHERE item_id = ?", ("test_upsert_item",))
+            self.assertEqual(cursor.fetchone()[0], "2026-01-20T12:00:00.000000+00:00")
+
+            # Signals are updated in place when the rules change their output
+            test_item["direction"] = "neg"
+            db.upsert_item_and_annotations(conn, test_item)
+            cursor = conn.execute("SELECT direction, urgency FROM signals WHERE item_id = ?", ("test_upsert_item",))
+            self.assertEqual(tuple(cursor.fetchone()), ("neg", "high"))
+        finally:
+            conn.close()
+
+    def test_upsert_items_and_annotations_batch(self):
+        """Test that a batch upsert counts only new items and refreshes existing ones."""
+        conn = db.connect()
+
+        def make_item(item_id, title, topics):
+            return {
+                "item_id": item_id,
+                "source_id": "test_source",
+                "published_at": None,
+                "fetched_at": "2026-01-20T12:00:00.000000+00:00",
+                "title": title,
+                "url": f"https://example.com/{item_id}",
+                "topics": topics,
+                "asset_classes": [],
+                "geo_tags": ["US"],
+                "direction": "neutral",
+                "urgency": "low",
+                "mode": "unknown",
+            }
+
+        try:
+            self.assertTrue(db.upsert_item_and_annotations(conn, make_item("batch_a", "First A", ["fed"])))
+
+            added = db.upsert_items_and_annotations(conn, [
+                make_item("batch_a", "Updated A", ["fed", "rates"]),
+                make_item("batch_b", "First B", []),
+                make_item("batch_b", "Repeated B", []),
+            ])
+            self.assertEqual(added, 1)
+
+            titles = dict(conn.execute("SELECT item_id, title FROM items ORDER BY item_id").fetchall())
+            self.assertEqual(titles, {"batch_a": "Updated A", "batch_b": "Repeated B"})
+            tags = [r[0] for r in conn.execute("SELECT tag FROM item_tags WHERE item_id = 'batch_a' ORDER BY tag")]
+            self.assertEqual(tags, ["US", "fed", "rates"])
+            # Rule tags come from init_db's seeding; only unknown tags are seeded on upsert
+            descriptions = dict(conn.execute("SELECT tag, description FROM tags WHERE tag IN ('fed', 'batchtag')"))
+            self.assertEqual(descriptions, {"fed": "Auto topic tag: fed"})
+            db.upsert_items_and_annotations(conn, [make_item("batch_c", "First C", ["batchtag", "batchtag"])])
+            row = conn.execute("SELECT tag_type, description FROM tags WHERE tag = 'batchtag'").fetchone()
+            self.assertEqual(tuple(row), ("topic", "Manual topic tag: batchtag"))
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM signals").fetchone()[0], 3)
+            self.assertEqual(db.upsert_items_and_annotations(conn, []), 0)
+        finally:
+            conn.close()
+
+    def test_connect_applies_connection_pragmas(self):
+        """Test that connect() configures every new connection."""
+        conn = db.connect()
+        try:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+            self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 1)  # NORMAL
+            self.assertEqual(conn.execute("PRAGMA temp_store").fetchone()[0], 2)  # MEMORY
+            self.assertEqual(conn.execute("PRAGMA cache_size").fetchone()[0], -65536)
+            self.assertEqual(conn.execute("PRAGMA busy_timeout").fetchone()[0], 30000)
+            self.assertEqual(conn.execute("PRAGMA mmap_size").fetchone()[0], 268435456)
+            self.assertIs(conn.row_factory, sqlite3.Row)
+        finally:
+            conn.close()
+
+    def test_connect_applies_pragmas_when_wal_fails(self):
+        """Test that a failing WAL switch doesn't skip the tuning PRAGMAs."""
+        class NoWalConnection(sqlite3.Connection):
+            def execute(self, sql, *args):
+                if sql == "PRAGMA journal_mode=WAL":
+                    raise sqlite3.OperationalError("disk I/O error")
+                return super().execute(sql, *args)
+
+        real_connect = sqlite3.connect
+        with patch.object(sqlite3, "connect", lambda *a, **k: real_connect(*a, factory=NoWalConnection, **k)):
+            conn = db.connect()
+        try:
+            self.assertEqual(conn.execute("PRAGMA synchronous").fetchone()[0], 1)  # NORMAL
+            self.assertEqual(conn.execute("PRAGMA cache_size").fetchone()[0], -65536)
+        finally:
+            conn.close()
+
+    def test_init_db_adds_effective_time_to_existing_items(self):
+        """Test that init_db migrates an items table created without effective_time."""
+        conn = sqlite3.connect(db.DB_PATH)
+        try:
+            conn.execute("DROP INDEX idx_items_effective_time_source")
+            conn.execute("ALTER TABLE items DROP COLUMN effective_time")
+            conn.execute(
+                "INSERT INTO items(item_id, source_id, published_at, fetched_at, title, url) "
+                "VALUES('old_item', 'test_source', NULL, '2026-01-20T12:00:00+00:00', 'Old', 'https://example.com/old')"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        db.init_db([])
+
+        conn = sqlite3.connect(db.DB_PATH)
+        try:
+            row = conn.execute("SELECT effective_time FROM items WHERE item_id = 'old_item'").fetchone()
+            self.assertEqual(row[0], "2026-01-20T12:00:00+00:00")
+            indexes = [r[1] for r in conn.execute("PRAGMA index_list(items)")]
+            self.assertIn("idx_items_effective_time_source", indexes)
         finally:
             conn.close()
 
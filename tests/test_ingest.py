@@ -3,6 +3,7 @@
 import os
 import sqlite3
 import tempfile
+import threading
 import unittest
 from unittest.mock import patch
 
@@ -68,7 +69,7 @@ class TestIngest(unittest.TestCase):
     def test_deduplication(self):
         """Test that ingesting the same feed twice doesn't create duplicates."""
         # Mock the fetch function to return our test feed
-        def mock_fetch_feed(url):
+        def mock_fetch_feed(url, etag=None, modified=None):
             if "sample_feed_1.xml" in url:
                 fixture_path = os.path.join(os.path.dirname(__file__), "fixtures", "sample_feed_1.xml")
                 with open(fixture_path, 'rb') as f:
@@ -92,6 +93,146 @@ class TestIngest(unittest.TestCase):
             self.assertEqual(initial_count, final_count,
                            f"Item count increased from {initial_count} to {final_count} - deduplication failed")
 
+    def test_feeds_fetched_concurrently(self):
+        """Test that feeds are fetched in parallel and all get ingested."""
+        # Each fetch waits for the other one, which only succeeds if both run at once
+        barrier = threading.Barrier(2, timeout=5)
+
+        def mock_fetch_feed(url, etag=None, modified=None):
+            barrier.wait()
+            fixture = "sample_feed_1.xml" if "sample_feed_1.xml" in url else "sample_feed_2.xml"
+            with open(os.path.join(os.path.dirname(__file__), "fixtures", fixture), 'rb') as f:
+                return feedparser.parse(f.read()), 200, None
+
+        with patch('src.ingest.fetch_feed_with_timeout', side_effect=mock_fetch_feed):
+            ingest.fetch_once()
+
+        status = ingest.get_fetch_status()
+        self.assertIsNone(status["last_error"])
+
+        conn = sqlite3.connect(db.DB_PATH, check_same_thread=False, timeout=30.0)
+        try:
+            sources = {row[0] for row in conn.execute("SELECT DISTINCT source_id FROM items")}
+        finally:
+            conn.close()
+        self.assertEqual(sources, {"test_feed_1", "test_feed_2"})
+
+    def test_fetch_sends_validators_and_handles_not_modified(self):
+        """Test that stored ETag/Last-Modified are sent and a 304 is not treated as an error."""
+        import urllib.error
+
+        requests = []
+
+        def mock_urlopen(req, timeout=None):
+            requests.append(req)
+            raise urllib.error.HTTPError(req.full_url, 304, "Not Modified", {}, None)
+
+        with patch('src.ingest.urllib.request.urlopen', side_effect=mock_urlopen):
+            result = ingest.fetch_feed_with_timeout(
+                "https://example.com/feed", '"v1"', "Tue, 20 Jan 2026 12:00:00 GMT")
+
+        self.assertEqual(result, (None, 304, None))
+        self.assertEqual(requests[0].get_header("If-none-match"), '"v1"')
+        self.assertEqual(requests[0].get_header("If-modified-since"), "Tue, 20 Jan 2026 12:00:00 GMT")
+
+    def test_unchanged_feeds_are_skipped(self):
+        """Test that validators are stored per source and reused on the next fetch."""
+        calls = []
+
+        def mock_fetch_feed(url, etag=None, modified=None):
+            calls.append((url, etag, modified))
+            if etag == '"v1"':
+                return None, 304, None
+            fixture = "sample_feed_1.xml" if "sample_feed_1.xml" in url else "sample_feed_2.xml"
+            with open(os.path.join(os.path.dirname(__file__), "fixtures", fixture), 'rb') as f:
+                parsed = feedparser.parse(f.read())
+            parsed["etag"] = '"v1"'
+            parsed["modified"] = "Tue, 20 Jan 2026 12:00:00 GMT"
+            return parsed, 200, None
+
+        with patch('src.ingest.fetch_feed_with_timeout', side_effect=mock_fetch_feed):
+            ingest.fetch_once()
+            initial_count = self.count_items()
+            ingest.fetch_once()
+
+        self.assertEqual(self.count_items(), initial_count)
+        self.assertEqual([c[1] for c in calls[2:]], ['"v1"', '"v1"'])
+        self.assertIsNone(ingest.get_fetch_status()["last_error"])
+
+        conn = sqlite3.connect(db.DB_PATH, check_same_thread=False, timeout=30.0)
+        try:
+            rows = conn.execute(
+                "SELECT etag, last_modified, last_http_status, last_error FROM source_status").fetchall()
+        finally:
+            conn.close()
+        self.assertEqual(rows, [('"v1"', "Tue, 20 Jan 2026 12:00:00 GMT", 304, None)] * 2)
+
+    def test_fetch_loop_reuses_one_connection(self):
+        """Test that the worker loop keeps a single connection across fetch runs."""
+        stop_event = threading.Event()
+        fetched = []
+
+        def mock_fetch_feed(url, etag=None, modified=None):
+            fetched.append(url)
+            if len(fetched) == 4:  # both feeds fetched twice
+                stop_event.set()
+            fixture = "sample_feed_1.xml" if "sample_feed_1.xml" in url else "sample_feed_2.xml"
+            with open(os.path.join(os.path.dirname(__file__), "fixtures", fixture), 'rb') as f:
+                return feedparser.parse(f.read()), 200, None
+
+        with patch('src.ingest.fetch_feed_with_timeout', side_effect=mock_fetch_feed), \
+                patch('src.ingest.db.connect', wraps=db.connect) as mock_connect:
+            ingest.fetch_loop(stop_event, 0, threading.Event())
+
+        self.assertEqual(len(fetched), 4)
+        self.assertEqual(mock_connect.call_count, 1)
+        self.assertGreater(self.count_items(), 0)
+
+    def test_fetch_loop_wakes_on_request(self):
+        """Test that request_fetch() runs the next fetch without waiting out the interval."""
+        stop_event = threading.Event()
+        wake_event = threading.Event()
+        fetched = threading.Semaphore(0)
+
+        def mock_fetch_once(conn):
+            fetched.release()
+
+        worker = threading.Thread(target=ingest.fetch_loop, args=(stop_event, 3600, wake_event), daemon=True)
+        with patch('src.ingest.fetch_once', side_effect=mock_fetch_once):
+            worker.start()
+            self.assertTrue(fetched.acquire(timeout=5))  # initial fetch
+
+            ingest.request_fetch(wake_event)
+            self.assertTrue(fetched.acquire(timeout=5))
+
+            ingest.stop_fetch_loop(stop_event, wake_event)
+            worker.join(5)
+
+        self.assertFalse(worker.is_alive())
+        self.assertFalse(fetched.acquire(timeout=0))  # no fetch after stopping
+
+    def test_fetch_loop_keeps_request_made_mid_fetch(self):
+        """Test that a fetch requested while a fetch is running gets a run of its own."""
+        stop_event = threading.Event()
+        wake_event = threading.Event()
+        runs = []
+
+        def mock_fetch_once(conn):
+            runs.append(conn)
+            if len(runs) == 1:
+                # Requested after this run's feeds were read
+                ingest.request_fetch(wake_event)
+            else:
+                ingest.stop_fetch_loop(stop_event, wake_event)
+
+        worker = threading.Thread(target=ingest.fetch_loop, args=(stop_event, 3600, wake_event), daemon=True)
+        with patch('src.ingest.fetch_once', side_effect=mock_fetch_once):
+            worker.start()
+            worker.join(5)
+
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(len(runs), 2)
+
     def test_known_headlines_tagging(self):
         """Test that known headlines get expected tags and signals."""
         # Test data: title -> expected tags/signals
@@ -138,7 +279,7 @@ class TestIngest(unittest.TestCase):
             }
         }
 
-        def mock_fetch_feed(url):
+        def mock_fetch_feed(url, etag=None, modified=None):
             fixture_path = os.path.join(os.path.dirname(__file__), "fixtures", "sample_feed_1.xml")
             with open(fixture_path, 'rb') as f:
                 feed_bytes = f.read()
@@ -223,7 +364,7 @@ class TestIngest(unittest.TestCase):
     def test_database_cleanup(self):
         """Test database cleanup functionality."""
         # First ingest some data
-        def mock_fetch_feed(url):
+        def mock_fetch_feed(url, etag=None, modified=None):
             fixture_path = os.path.join(os.path.dirname(__file__), "fixtures", "sample_feed_1.xml")
             with open(fixture_path, 'rb') as f:
                 feed_bytes = f.read()
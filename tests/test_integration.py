@@ -56,7 +56,7 @@ class TestIntegration(unittest.TestCase):
     def test_full_ingestion_pipeline(self):
         """Test complete ingestion pipeline with mocked RSS feeds."""
         # Mock the RSS fetch to return our test feeds
-        def mock_fetch_feed(url):
+        def mock_fetch_feed(url, etag=None, modified=None):
             if "sample_feed_crypto.xml" in url:
                 fixture_path = os.path.join(os.path.dirname(__file__), "fixtures", "sample_feed_crypto.xml")
                 with open(fixture_path, 'rb') as f:
@@ -125,7 +125,7 @@ class TestIntegration(unittest.TestCase):
 
     def test_source_health_tracking(self):
         """Test that source health is properly tracked after ingestion."""
-        def mock_fetch_feed(url):
+        def mock_fetch_feed(url, etag=None, modified=None):
             if "sample_feed_crypto.xml" in url:
                 fixture_path = os.path.join(os.path.dirname(__file__), "fixtures", "sample_feed_crypto.xml")
                 with open(fixture_path, 'rb') as f:
@@ -157,7 +157,7 @@ class TestIntegration(unittest.TestCase):
 
     def test_topic_usage_statistics(self):
         """Test that topic usage statistics are accurate after ingestion."""
-        def mock_fetch_feed(url):
+        def mock_fetch_feed(url, etag=None, modified=None):
             if "sample_feed_crypto.xml" in url:
                 fixture_path = os.path.join(os.path.dirname(__file__), "fixtures", "sample_feed_crypto.xml")
                 with open(fixture_path, 'rb') as f:
@@ -0,0 +1,55 @@
+"""Tests for the keyword prefilter."""
+
+import unittest
+
+from src import keywords
+
+
+class TestKeywords(unittest.TestCase):
+    """Test literal extraction and the Aho-Corasick prefilter."""
+
+    def test_required_literals(self):
+        """Test literal extraction from typical rule patterns."""
+        test_cases = [
+            (r"\brate(s)?\b", ["rate"]),
+            (r"\bbeats?\b", ["beat"]),
+            (r"\b10-?year\b", ["10"]),
+            (r"\bS&P\b", ["s&p"]),
+            (r"\bcentral bank\b", ["central bank"]),
+            (r"\bas\b.*\bfall(s|ing)?\b", ["as"]),
+            (r"\bfoo\b|\bbar\b", ["foo", "bar"]),
+        ]
+
+        for pattern, expected in test_cases:
+            with self.subTest(pattern=pattern):
+                self.assertEqual(keywords.required_literals(pattern), expected)
+
+    def test_required_literals_unknown(self):
+        """Test that patterns without a leading literal are not prefiltered."""
+        for pattern in [r"[abc]x", r"(?i)foo", r"\bfoo\b|\w+", r"x?yz"]:
+            with self.subTest(pattern=pattern):
+                self.assertIsNone(keywords.required_literals(pattern))
+
+    def test_scan_reports_candidate_categories(self):
+        """Test that scan() returns the bits of categories whose keywords occur."""
+        prefilter = keywords.KeywordPrefilter()
+        rates = prefilter.add([r"\brate(s)?\b", r"\byield(s)?\b"])
+        fed = prefilter.add([r"\bFed\b", r"\bFOMC\b"])
+        other = prefilter.add([r"[0-9]+ bps"])
+
+        self.assertEqual(prefilter.scan("FOMC holds RATES"), rates | fed | other)
+        self.assertEqual(prefilter.scan("Yields climb"), rates | other)
+        self.assertEqual(prefilter.scan("Nothing here"), other)
+
+    def test_scan_folds_case_like_re(self):
+        """Test that non-ASCII characters re.IGNORECASE folds to ASCII are handled."""
+        prefilter = keywords.KeywordPrefilter()
+        stocks = prefilter.add([r"\bstocks?\b"])
+
+        self.assertEqual(prefilter.scan("ſtocks slide"), stocks)
+        self.assertEqual(prefilter.scan("China’s STOCKS slide"), stocks)
+        self.assertEqual(keywords.fold_case("İSTANBUL ſtocks"), "istanbul stocks")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""Tests for the re-tagging script."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import retag_existing
+from src import db, rules
+
+TITLES = [
+    "Fed holds rates steady as inflation cools",
+    "China stocks slide on property fears",
+    "Local bakery opens second shop",
+]
+
+
+class TestRetagExisting(unittest.TestCase):
+    """Test re-tagging existing items in batches, in and out of process."""
+
+    def setUp(self):
+        """Set up a test database of untagged items."""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db.close()
+
+        # Override DB_PATH for testing
+        self.original_db_path = db.DB_PATH
+        db.DB_PATH = self.temp_db.name
+
+        db.init_db([
+            {
+                "source_id": "test_source",
+                "publisher": "Test Publisher",
+                "feed_name": "Test Feed",
+                "category": "A",
+                "rss_url": "https://example.com/feed",
+                "enabled": True
+            }
+        ])
+
+        self.titles = {f"retag_{i}": TITLES[i % len(TITLES)] for i in range(10)}
+        conn = db.connect()
+        try:
+            for item_id, title in self.titles.items():
+                db.upsert_item_and_annotations(conn, {
+                    "item_id": item_id,
+                    "source_id": "test_source",
+                    "published_at": "2026-01-20T12:00:00+00:00",
+                    "fetched_at": "2026-01-20T12:00:00+00:00",
+                    "title": title,
+                    "url": f"https://example.com/{item_id}",
+                    "topics": [],
+                    "asset_classes": [],
+                    "geo_tags": [],
+                    "direction": "neg",
+                    "urgency": "low",
+                    "mode": "unknown",
+                })
+            conn.commit()
+        finally:
+            conn.close()
+
+    def tearDown(self):
+        """Clean up test database."""
+        db.DB_PATH = self.original_db_path
+        try:
+            os.unlink(self.temp_db.name)
+        except OSError:
+            pass
+
+    def test_retag_existing_items(self):
+        """Test that every item gets its rule tags across chunk and batch boundaries."""
+        expected = {
+            (item_id, tag)
+            for item_id, title in self.titles.items()
+            for tag in rules.tag_topics(title) + rules.tag_asset_class(title) + rules.tag_geo(title)
+        }
+        self.assertIn(("retag_0", "fed"), expected)
+        self.assertIn(("retag_1", "China"), expected)
+
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                conn = db.connect()
+                try:
+                    conn.execute("DELETE FROM item_tags")
+                    conn.commit()
+                finally:
+                    conn.close()
+
+                # 10 items in chunks of 3 and tag rows flushed every 4
+                with patch.object(retag_existing, "CHUNK_SIZE", 3), patch.object(retag_existing, "BATCH_SIZE", 4):
+                    retag_existing.retag_existing_items(workers=workers)
+
+                conn = db.connect()
+                try:
+                    rows = conn.execute("SELECT item_id, tag, tagger FROM item_tags").fetchall()
+                    signals = conn.execute("SELECT item_id, direction FROM signals").fetchall()
+                finally:
+                    conn.close()
+
+                self.assertEqual({(r["item_id"], r["tag"]) for r in rows}, expected)
+                self.assertEqual({r["tagger"] for r in rows}, {"retag_script"})
+                # Re-tagging leaves the item signals alone
+                self.assertEqual(sorted(tuple(r) for r in signals),
+                                 sorted((item_id, "neg") for item_id in self.titles))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 """Tests for rule-based tagging and classification."""
 
 import unittest
+from unittest.mock import patch
 from datetime import datetime
 
 from src import rules, utils
@@ -54,6 +55,68 @@ class TestRules(unittest.TestCase):
         id6 = utils.stable_item_id("test_source", "Test Title", "https://example.com", "different-guid")
         self.assertNotEqual(id1, id6)
 
+    def test_normalize_title_for_hash(self):
+        """Test whitespace normalization and publisher suffix stripping."""
+        test_cases = [
+            ("  Stocks   Rally\tToday ", "stocks rally today"),
+            ("Stocks Rally - Reuters", "stocks rally"),
+            ("Stocks Rally  -   WSJ", "stocks rally"),
+            ("Stocks Rally - WSJ - Reuters", "stocks rally"),
+            ("Stocks Rally - Reuters - WSJ", "stocks rally - reuters"),
+            ("- Reuters", "- reuters"),
+        ]
+
+        for title, expected in test_cases:
+            with self.subTest(title=title):
+                self.assertEqual(utils.normalize_title_for_hash(title, "test_source"), expected)
+
+    def test_normalize_ws(self):
+        """Test whitespace collapsing, including the already-normalized fast path."""
+        test_cases = [
+            ("Stocks rally", "Stocks rally"),
+            ("  Stocks   rally ", "Stocks rally"),
+            ("Stocks\trally\n", "Stocks rally"),
+            ("Stocks\xa0rally", "Stocks rally"),
+            ("Stocks\u2028rally", "Stocks rally"),
+            ("", ""),
+        ]
+
+        for text, expected in test_cases:
+            with self.subTest(text=text):
+                self.assertEqual(utils.normalize_ws(text), expected)
+
+    def test_stable_item_id_is_persisted_format(self):
+        """Test that IDs keep the SHA-256 format already stored in existing databases."""
+        import hashlib
+
+        item_id = utils.stable_item_id("test_source", "Test  Title - Reuters", "https://example.com", None)
+        expected = hashlib.sha256(b"test_source|test title|https://example.com").hexdigest()
+        self.assertEqual(item_id, expected)
+
+    def test_parse_published(self):
+        """Test published date parsing from feedparser structs and raw strings."""
+        import time
+        from types import SimpleNamespace
+
+        import feedparser
+
+        expected = "2026-01-20T12:00:00+00:00"
+        test_cases = [
+            SimpleNamespace(published_parsed=time.struct_time((2026, 1, 20, 12, 0, 0, 1, 20, 0))),
+            SimpleNamespace(published_parsed=None, updated="2026-01-20T12:00:00Z"),
+            SimpleNamespace(published="Tue, 20 Jan 2026 07:00:00 -0500"),
+            SimpleNamespace(published="2026-01-20 12:00:00"),
+            SimpleNamespace(published="January 20, 2026 12:00 PM"),
+            feedparser.FeedParserDict(updated="2026-01-20T12:00:00Z"),
+        ]
+
+        for entry in test_cases:
+            with self.subTest(entry=entry):
+                self.assertEqual(utils.parse_published(entry).isoformat(), expected)
+
+        self.assertIsNone(utils.parse_published(SimpleNamespace(published="not a date")))
+        self.assertIsNone(utils.parse_published(SimpleNamespace()))
+
     def test_tag_topics(self):
         """Test topic tagging with known examples."""
         test_cases = [
@@ -171,6 +234,29 @@ class TestRules(unittest.TestCase):
                 self.assertEqual(actual_mode, expected_mode,
                                f"Expected mode '{expected_mode}' but got '{actual_mode}' for: {title}")
 
+    def test_compile_patterns_skips_invalid(self):
+        """Test that invalid rule patterns are skipped instead of raising."""
+        compiled = rules.compile_patterns([r"\bvalid\b", r"(unclosed"])
+        self.assertEqual(len(compiled), 1)
+        self.assertTrue(compiled[0].search("A VALID headline"))
+        self.assertIsNone(compiled[0].search("Nothing here"))
+
+    def test_fuse_patterns(self):
+        """Test that fused alternations match like the individual patterns."""
+        fused = rules.fuse_patterns([r"\brate(s)?\b", r"\bYield(s)?\b", r"(unclosed"])
+        self.assertIsNotNone(fused.search(rules.fold_case("Yields climb")))
+        self.assertIsNotNone(fused.search(rules.fold_case("RATES hold")))
+        self.assertIsNone(fused.search(rules.fold_case("Curated list")))
+
+        # An empty rule list must never match
+        self.assertIsNone(rules.fuse_patterns([]).search("anything"))
+
+    def test_fold_pattern(self):
+        """Test that only literal characters are lowercased, not escapes."""
+        self.assertEqual(rules.fold_pattern(r"\bFed\b"), r"\bfed\b")
+        self.assertEqual(rules.fold_pattern(r"\bS&P\S*\B"), r"\bs&p\S*\B")
+        self.assertEqual(rules.fold_pattern(r"[A-Z]\W"), r"[a-z]\W")
+
     def test_apply_all_tagging(self):
         """Test the comprehensive tagging function."""
         title = "Fed Signals Rate Cuts as US Economy Slows"
@@ -192,6 +278,54 @@ class TestRules(unittest.TestCase):
         self.assertEqual(result["urgency"], "low")
         self.assertEqual(result["mode"], "policy")
 
+    def test_apply_all_tagging_reuses_cached_result(self):
+        """Test that repeated titles are served from the cache as independent copies."""
+        title = "Gold Rallies as Stocks Slide"
+        first = rules.apply_all_tagging(title)
+        first["asset_classes"].append("mutated")
+
+        hits = rules._tag_folded.cache_info().hits
+        second = rules.apply_all_tagging(title.upper())
+        self.assertEqual(rules._tag_folded.cache_info().hits, hits + 1)
+        self.assertNotIn("mutated", second["asset_classes"])
+        self.assertIn("commodities", second["asset_classes"])
+
+    @unittest.skipUnless(rules.hyperscan, "hyperscan is not installed")
+    def test_hyperscan_tagging_matches_re(self):
+        """Test that the Hyperscan backend tags exactly like the re matchers."""
+        # Hyperscan rejects \b in Unicode mode, so \b rules must stay on re
+        # rather than match ASCII-only word boundaries
+        with patch.object(rules, "_TAGGING_RULES", [("topics", [("fed", [r"\bfed\b"])])]):
+            self.assertIsNone(rules.build_hyperscan_database())
+        with patch.object(rules, "_TAGGING_RULES", [("topics", [("fed", [r"fed\w"])])]):
+            database, categories = rules.build_hyperscan_database()
+        hits = []
+        database.scan("fedé".encode("utf-8"), match_event_handler=rules._collect_match, context=hits,
+                      scratch=rules.hyperscan.Scratch(database))
+        self.assertEqual((hits, categories), ([0], [("topics", "fed")]))
+
+        titles = [
+            "Fed Signals Rate Cuts as US Economy Slows",
+            "Stocks Plunge on Weak Data but Gold Rallies",
+            "Why Inflation May Be Peaking",
+            "ECB Holds Rates Steady; Euro Falls Against Dollar",
+            "China’s STOCKS slide amid Panic Selling",
+            # Non-ASCII letters next to keywords: \b must not see a word boundary
+            "Fedé cuts while Ratesé hold",
+            "Çhina exports, Japanés yields",
+            "Nothing to see here",
+        ]
+        for title in titles:
+            with self.subTest(title=title):
+                self.assertEqual(rules.apply_all_tagging(title), {
+                    "topics": rules.tag_topics(title),
+                    "asset_classes": rules.tag_asset_class(title),
+                    "geo_tags": rules.tag_geo(title),
+                    "direction": rules.classify_direction(title),
+                    "urgency": rules.classify_urgency(title),
+                    "mode": rules.classify_mode(title),
+                })
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -85,6 +85,15 @@ class TestRulesConfig(unittest.TestCase):
         self.assertIn("rates", result)
         self.assertEqual(len(result), len(rules_config.DEFAULT_TOPIC_RULES))
 
+    @patch('src.rules_config.get_config_dir')
+    def test_load_rules_does_not_create_config_dir(self, mock_get_dir):
+        """Test that loading rules without a config directory only reads."""
+        missing_dir = self.config_dir / "missing"
+        mock_get_dir.return_value = missing_dir
+
+        self.assertEqual(rules_config.load_geo_rules(), rules_config.DEFAULT_GEO_RULES)
+        self.assertFalse(missing_dir.exists())
+
     @patch('src.rules_config.get_config_dir')
     def test_load_topic_rules_invalid_config(self, mock_get_dir):
         """Test that invalid config falls back to defaults."""
@@ -137,6 +146,7 @@ class TestRulesConfig(unittest.TestCase):
 
         self.assertTrue(topics_example.exists())
         self.assertTrue(assets_example.exists())
+        self.assertEqual(sorted(p.name for p in self.config_dir.glob("*.tmp")), [])
 
         # Check content
         with open(topics_example) as f:
@@ -80,6 +80,31 @@ class TestWeb(unittest.TestCase):
         except OSError:
             pass
 
+    def _insert_item(self, item_id, **overrides):
+        """Insert an untagged, neutral market_news item published now, with ``overrides`` applied."""
+        from src import utils
+
+        now = utils.utcnow().isoformat()
+        item = {
+            "item_id": item_id,
+            "source_id": "market_news",
+            "published_at": now,
+            "fetched_at": now,
+            "title": f"Headline {item_id}",
+            "url": f"https://example.com/{item_id}",
+            "topics": [],
+            "asset_classes": [],
+            "geo_tags": [],
+            "direction": "neutral",
+            "urgency": "low",
+            "mode": "unknown",
+        }
+        item.update(overrides)
+        with self.app.app_context():
+            conn = db.get_db()
+            db.upsert_item_and_annotations(conn, item)
+            conn.commit()
+
     def test_category_mapping_descriptions(self):
         """Test that category codes map to correct descriptive names."""
         category_mappings = {
@@ -90,24 +115,7 @@ class TestWeb(unittest.TestCase):
             "E": "📊 Other"
         }
 
-        for category_code, expected_description in category_mappings.items():
-            with self.subTest(category=category_code):
-                # This test verifies the mapping logic used in the template
-                # Since we can't easily test Jinja2 template rendering directly,
-                # we test the logic that would be used
-                if category_code == "A":
-                    result = "📈 Market News"
-                elif category_code == "B":
-                    result = "📰 Interpretive/Opinion"
-                elif category_code == "C":
-                    result = "🏛️ Macro/Policy Anchors"
-                elif category_code == "D":
-                    result = "💼 Practitioner Commentary"
-                else:
-                    result = "📊 Other"
-
-                self.assertEqual(result, expected_description,
-                               f"Category {category_code} should map to '{expected_description}'")
+        self.assertEqual(web.CATEGORY_LABELS, category_mappings)
 
     def test_index_route_without_filters(self):
         """Test index route loads without filters."""
@@ -140,16 +148,283 @@ class TestWeb(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIn(b'Test Dashboard', response.data)
 
+    def test_category_filter_applies_to_undated_items(self):
+        """Test that items without published_at still respect the category filter."""
+        self._insert_item(
+            "undated_opinion_item",
+            source_id="opinion_news",  # Category B
+            published_at=None,
+            title="Undated Opinion Headline",
+        )
+
+        response = self.client.get('/?category=B')
+        self.assertIn(b'Undated Opinion Headline', response.data)
+
+        response = self.client.get('/?category=A')
+        self.assertNotIn(b'Undated Opinion Headline', response.data)
+
+    def test_topic_filter_lists_each_item_once(self):
+        """Test that the topic filter matches tagged items without counting them twice."""
+        self._insert_item("multi_tag_item", topics=["fed", "rates", "inflation"])
+        self._insert_item("untagged_item")
+
+        response = self.client.get('/')
+        self.assertEqual(response.data.count(b'Headline multi_tag_item'), 1)
+        self.assertIn(b'Headline untagged_item', response.data)
+        self.assertIn(b'const skew = {"mixed": 0, "neg": 0, "neutral": 2, "pos": 0};', response.data)
+
+        response = self.client.get('/?topic=rates')
+        self.assertEqual(response.data.count(b'Headline multi_tag_item'), 1)
+        self.assertNotIn(b'Headline untagged_item', response.data)
+        self.assertIn(b'const skew = {"mixed": 0, "neg": 0, "neutral": 1, "pos": 0};', response.data)
+
+    def test_items_show_asset_class_and_geo_tags(self):
+        """Test that each item's asset-class and geo tags are listed in tag order."""
+        self._insert_item("badge_item", topics=["fed"], asset_classes=["fx", "equities"], geo_tags=["US"])
+
+        response = self.client.get('/')
+        self.assertRegex(
+            response.data.decode(),
+            r'badge-asset">equities</span>\s*<span class="badge badge-asset">fx</span>'
+            r'\s*<span class="badge badge-geo">US</span>',
+        )
+
+    def test_topic_counts_cached_until_next_fetch(self):
+        """Test that topic counts and acceleration are reused until the fetch epoch changes."""
+        from src import ingest
+
+        epoch = ingest.get_fetch_epoch()
+        with patch.object(ingest, "get_fetch_epoch", return_value=epoch):
+            response = self.client.get('/')
+            self.assertIn(b'const topicLabels = [];', response.data)
+
+        self._insert_item("cached_topic_item", topics=["cachetag"])
+
+        with patch.object(ingest, "get_fetch_epoch", return_value=epoch):
+            response = self.client.get('/')
+            self.assertIn(b'const topicLabels = [];', response.data)
+            self.assertIn(b'No acceleration data available', response.data)
+
+        with patch.object(ingest, "get_fetch_epoch", return_value=epoch + 1):
+            response = self.client.get('/')
+            self.assertIn(b'const topicLabels = ["cachetag"];', response.data)
+            self.assertIn(b'>cachetag</td>', response.data)
+
+    def test_index_not_modified_until_next_fetch(self):
+        """Test that the dashboard answers a matching If-None-Match with 304 until the data changes."""
+        from src import ingest
+
+        epoch = ingest.get_fetch_epoch()
+        with patch.object(ingest, "get_fetch_epoch", return_value=epoch):
+            with self.client.get('/?lookback=24') as response:
+                etag = response.headers["ETag"]
+                self.assertEqual(response.headers["Cache-Control"], "private, no-cache")
+
+            response = self.client.get('/?lookback=24', headers={"If-None-Match": etag})
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response.data, b'')
+
+            with self.client.get('/?lookback=48', headers={"If-None-Match": etag}) as response:
+                self.assertEqual(response.status_code, 200)
+
+        with patch.object(ingest, "get_fetch_epoch", return_value=epoch + 1):
+            with self.client.get('/?lookback=24', headers={"If-None-Match": etag}) as response:
+                self.assertEqual(response.status_code, 200)
+                self.assertNotEqual(response.headers["ETag"], etag)
+
+    def test_chart_data_is_script_safe_json(self):
+        """Test that chart labels are emitted as JSON that can't close the script block."""
+        self._insert_item("script_tag_item", topics=["it's</script>"])
+
+        response = self.client.get('/')
+        self.assertIn(b'const topicLabels = ["it\\u0027s\\u003c/script\\u003e"];', response.data)
+        self.assertIn(b'const topicCounts = [1];', response.data)
+        self.assertIn(b'const skew = {"mixed": 0, "neg": 0, "neutral": 1, "pos": 0};', response.data)
+
+    def test_topic_counts_query_uses_time_index(self):
+        """Test that topic counts are driven by the effective_time index, not a full item_tags scan."""
+        statements = []
+        real_connect = db.connect
+
+        def tracing_connect():
+            conn = real_connect()
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        with patch.object(db, "connect", tracing_connect):
+            self.client.get('/')
+
+        sql = next(s for s in statements if "GROUP BY it.tag" in s and "LIMIT 20" in s)
+        conn = db.connect()
+        try:
+            plan = " | ".join(row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql))
+        finally:
+            conn.close()
+        self.assertIn("idx_items_effective_time_source", plan)
+        self.assertNotIn("SCAN it", plan)
+
+    def test_framing_skew_query_uses_time_index(self):
+        """Test that framing skew searches the effective_time index instead of scanning items."""
+        statements = []
+        real_connect = db.connect
+
+        def tracing_connect():
+            conn = real_connect()
+            conn.set_trace_callback(statements.append)
+            return conn
+
+        with patch.object(db, "connect", tracing_connect):
+            self.client.get('/?topic=fed')
+
+        sql = next(s for s in statements if "GROUP BY sig.direction" in s)
+        conn = db.connect()
+        try:
+            plan = " | ".join(row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql))
+        finally:
+            conn.close()
+        self.assertIn("SEARCH i USING", plan)
+        self.assertIn("idx_items_effective_time_source", plan)
+
+    def test_request_connections_are_pooled(self):
+        """Test that requests reuse a pooled connection without carrying over uncommitted writes."""
+        with self.app.app_context():
+            conn = db.get_db()
+            db.set_maintenance_state(conn, "pool_test", "x")
+
+        with self.app.app_context():
+            self.assertIs(db.get_db(), conn)
+            self.assertFalse(conn.in_transaction)
+            self.assertIsNone(db.get_maintenance_state(conn, "pool_test"))
+
+    def test_acceleration_counts_both_windows(self):
+        """Test that acceleration counts tags in the last 6h against the 6h before, biggest rise first."""
+        from datetime import timedelta
+        from src import utils
+
+        now = utils.utcnow()
+        for item_id, hours_ago, topics in [
+            ("accel_a1", 1, ["acceltag", "risingtag"]),
+            ("accel_a2", 2, ["acceltag", "risingtag"]),
+            ("accel_b1", 8, ["acceltag", "fadingtag"]),
+            ("accel_old", 20, ["acceltag"]),
+        ]:
+            published = (now - timedelta(hours=hours_ago)).isoformat()
+            self._insert_item(item_id, published_at=published, fetched_at=published, topics=topics)
+
+        with patch.object(web, "stream_template", return_value=iter([""])) as render:
+            self.client.get('/')
+
+        acceleration = render.call_args.kwargs["acceleration"]
+        self.assertEqual(acceleration, [
+            {"topic": "risingtag", "count_a": 2, "count_b": 0, "delta": 2, "ratio": 2.0},
+            {"topic": "acceltag", "count_a": 2, "count_b": 1, "delta": 1, "ratio": 2.0},
+            {"topic": "fadingtag", "count_a": 0, "count_b": 1, "delta": -1, "ratio": 0.0},
+        ])
+
+    def test_long_summaries_are_truncated(self):
+        """Test that summaries are cut at a word boundary before the two-line clamp."""
+        import re
+
+        self._insert_item("long_summary_item", summary="word " * 200 + "tail")
+
+        response = self.client.get('/')
+        summary = re.search(r'line-clamp-2">(word[^<]*)</p>', response.get_data(as_text=True)).group(1)
+        self.assertTrue(summary.endswith("word…"))
+        self.assertLessEqual(len(summary), web.SUMMARY_PREVIEW_CHARS)
+
+    def test_index_renders_fetch_status(self):
+        """Test that the ingestion status card shows the last fetch status."""
+        status = {"last_run_utc": "2026-01-20T12:00:00+00:00", "last_error": "boom", "items_added": 42}
+        with patch.object(web.ingest, "get_fetch_status", return_value=status):
+            response = self.client.get('/')
+
+        self.assertIn(b'2026-01-20T12:00:00+00:00', response.data)
+        self.assertIn(b'>42<', response.data)
+        self.assertIn(b'>boom<', response.data)
+
+    def test_index_reuses_rendered_page(self):
+        """Test that the same page version is rendered once and then served from the page cache."""
+        from src import ingest
+
+        epoch = ingest.get_fetch_epoch()
+        with patch.object(ingest, "get_fetch_epoch", return_value=epoch), \
+                patch.object(web, "stream_template", wraps=web.stream_template) as render:
+            first = self.client.get('/?lookback=24').data
+            second = self.client.get('/?lookback=24').data
+            self.assertEqual(render.call_count, 1)
+            self.assertEqual(first, second)
+
+            self.client.get('/?lookback=48').data
+            self.assertEqual(render.call_count, 2)
+
+    def test_page_cache_closes_source_on_disconnect(self):
+        """Test that an abandoned page closes the render stream and isn't cached."""
+        closed = []
+
+        def page():
+            try:
+                yield "<html>"
+                yield "</html>"
+            finally:
+                closed.append(True)
+
+        for wrap in (web._encoded, web._gzipped):
+            with self.subTest(wrap=wrap.__name__):
+                closed.clear()
+                cache = web.PageCache(8)
+                body = cache.tee("etag", wrap(page()))
+                next(body)
+                body.close()  # what the WSGI server does when the client goes away
+                self.assertEqual(closed, [True])
+                self.assertIsNone(cache.get("etag"))
+
+        cache = web.PageCache(8)
+        self.assertEqual(b"".join(cache.tee("etag", web._encoded(page()))), b"<html></html>")
+        self.assertEqual(cache.get("etag"), b"<html></html>")
+
+    def test_index_gzipped_when_accepted(self):
+        """Test that the dashboard is gzipped for clients that accept it, under its own ETag."""
+        import gzip
+
+        with self.client.get('/') as plain:
+            self.assertIsNone(plain.content_encoding)
+
+        response = self.client.get('/', headers={"Accept-Encoding": "gzip, deflate"})
+        self.assertEqual(response.content_encoding, "gzip")
+        self.assertIn("Accept-Encoding", response.vary)
+        self.assertNotEqual(response.headers["ETag"], plain.headers["ETag"])
+        self.assertIn(b'Test Dashboard', gzip.decompress(response.data))
+
+    def test_stylesheet_is_versioned_and_cached(self):
+        """Test that the dashboard links its stylesheet by content hash with long-lived caching."""
+        import re
+
+        response = self.client.get('/')
+        href = re.search(rb'href="(/static/dashboard\.css\?v=[0-9a-f]+)"', response.data).group(1).decode()
+
+        with self.client.get(href) as response:
+            self.assertEqual(response.status_code, 200)
+            self.assertIn(b':root', response.data)
+            self.assertTrue(response.cache_control.immutable)
+            self.assertEqual(response.cache_control.max_age, web.STATIC_MAX_AGE)
+
     def test_fetch_now_route(self):
-        """Test fetch now route."""
-        response = self.client.get('/fetch-now')
-        # Should redirect back to index
+        """Test that fetch now wakes the worker thread and redirects right away."""
+        with patch.object(web.ingest, "request_fetch") as request_fetch:
+            response = self.client.get('/fetch-now')
+        # Should redirect back to index without fetching in the request
         self.assertEqual(response.status_code, 302)
         self.assertIn('/', response.headers.get('Location', ''))
+        request_fetch.assert_called_once()
 
     def test_healthz_route(self):
         """Test health check endpoint."""
-        response = self.client.get('/healthz')
+        from src import utils
+
+        # Don't depend on whether a real fetch happened to finish earlier
+        status = {"last_run_utc": utils.utcnow().isoformat(), "last_error": None, "items_added": 0}
+        with patch.object(web.ingest, "get_fetch_status", return_value=status):
+            response = self.client.get('/healthz')
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data, b'OK')
 
@@ -170,6 +445,11 @@ class TestWeb(unittest.TestCase):
         response = self.client.get('/admin/maintenance')
         self.assertEqual(response.status_code, 200)
         self.assertIn(b'Database Maintenance', response.data)
+        self.assertIn(f"{db.get_retention_days()} days".encode(), response.data)
+        self.assertIn(b'>Never<', response.data)
+
+        response = self.client.get('/admin/maintenance?success=<done>')
+        self.assertIn(b'&lt;done&gt;', response.data)
 
     def test_template_renders_category_badges(self):
         """Test that templates render category badges correctly."""